@@ -14,22 +14,47 @@ Features unique to Plinko:
 - Slot-based payouts
 """
 
+import asyncio
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
-import statistics
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 import math
+import os
+import time
 
+import numpy as np
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
+from plinko_schema import RISK_LEVEL_IDS, RISK_LEVEL_NAMES
+
+try:
+    from numba import njit
+except ImportError:  # numba is in requirements.txt; without it the NumPy kernel is used
+    njit = None
+
 
 # =============================================================================
 # Configuration
 # =============================================================================
 
+# How long a computed /api/v2/plinko response is reused (0 disables caching)
+STATS_CACHE_TTL_SECONDS: float = float(os.getenv("PLINKO_STATS_TTL_SECONDS", "10"))
+
+
+# Theoretical probability (roughly 0.3% for high risk jackpot)
+JACKPOT_PROBABILITY = 0.3
+
+# Supported stats windows
+HOURS_MAP: Dict[str, int] = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
+
+# Rows pulled per round-trip to the aiosqlite thread when streaming a window
+DROP_FETCH_SIZE: int = 4096
+
+
 class PlinkoRiskLevel(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -60,6 +85,55 @@ THEORETICAL_DISTRIBUTION = {
     8: 0.162, 9: 0.194, 10: 0.194, 11: 0.162, 12: 0.108, 13: 0.054, 14: 0.018, 15: 0.003
 }
 
+# Risk levels in ordinal order; the per-risk tables below are tuples indexed
+# by RISK_IDX (unknown risk levels fall back to the index the caller picks).
+# These are the ids stored in plinko_rounds.risk_level
+RISK_LEVELS = RISK_LEVEL_NAMES
+RISK_IDX: Dict[str, int] = RISK_LEVEL_IDS
+
+# Array views of the tables above, built once at import for the hot paths
+PLINKO_SLOT_ARR = tuple(
+    np.array([PLINKO_SLOTS[risk][i] for i in range(16)], dtype=np.float64)
+    for risk in RISK_LEVELS
+)
+PLINKO_MAX = tuple(float(arr.max()) for arr in PLINKO_SLOT_ARR)
+THEO_ARR = np.array([THEORETICAL_DISTRIBUTION[i] for i in range(16)], dtype=np.float64)
+
+# Lower edges of the small/medium/big win buckets (below 1x is a loss)
+WIN_BUCKET_EDGES = np.array([1.0, 2.0, 10.0])
+
+
+def _win_bins(max_mult: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bin layout that yields win buckets and jackpot hits from one histogram.
+
+    Returns the sorted bin edges (win bucket edges plus the jackpot
+    threshold), the win bucket (0=loss .. 3=big) of every bin, and a mask
+    of the bins at or above the jackpot threshold.
+    """
+    edges = np.unique(np.append(WIN_BUCKET_EDGES, max_mult))
+    lower = np.concatenate(([-np.inf], edges))
+    bucket = np.searchsorted(WIN_BUCKET_EDGES, lower, side='right')
+    return edges, bucket, lower >= max_mult
+
+
+WIN_BINS = tuple(_win_bins(max_mult) for max_mult in PLINKO_MAX)
+
+# Keys of each TheoreticalVsActual.slot_comparisons entry, in column order
+SLOT_COMPARISON_KEYS = (
+    "slot", "observed", "expected", "actual_pct", "theoretical_pct", "deviation",
+)
+
+# Compact per-drop column types: slot ids fit in a byte and multipliers only
+# need display precision. Reductions accumulate in float64 (see _mean).
+SLOT_DTYPE = np.int8
+MULT_DTYPE = np.float32
+
+# Column-oriented view of a list of drops: (slots, multipliers, created_at)
+DropColumns = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+# Column-oriented view of an aggregated histogram: (slots, multipliers, hits)
+HistogramColumns = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
 
 # =============================================================================
 # Models
@@ -162,75 +236,221 @@ class PlinkoStatistics(BaseModel):
     overall_rtp: float
 
 
+def _empty_slot_distribution(risk_level: str) -> SlotDistribution:
+    """Slot distribution reported when there are no drops."""
+    return SlotDistribution(
+        total_drops=0,
+        risk_level=risk_level,
+        slots=[],
+        most_hit_slot=7,
+        least_hit_slot=0,
+        avg_multiplier=1.0,
+        edge_rate=0,
+        center_rate=0,
+        jackpot_rate=0,
+    )
+
+
+def _empty_fairness(risk_level: str) -> TheoreticalVsActual:
+    """Fairness analysis reported when there are no drops."""
+    return TheoreticalVsActual(
+        risk_level=risk_level,
+        chi_square_score=0,
+        deviation_score=0,
+        is_fair=True,
+        slot_comparisons=[],
+        overperforming_slots=[],
+        underperforming_slots=[],
+    )
+
+
+# Empty results are common (quiet hours, unused risk levels); build them once
+# and hand out the same instances instead of re-validating new models
+_EMPTY_SLOT_DISTRIBUTION_BY_RISK = {risk: _empty_slot_distribution(risk) for risk in RISK_LEVELS}
+_EMPTY_FAIRNESS_BY_RISK = {risk: _empty_fairness(risk) for risk in RISK_LEVELS}
+_EMPTY_JACKPOT = JackpotTracker(
+    total_jackpots=0,
+    drops_since_jackpot=0,
+    jackpot_probability=JACKPOT_PROBABILITY,
+    current_drought=False,
+)
+
+
 # =============================================================================
 # Calculator
 # =============================================================================
 
+def _fairness_kernel_loop(
+    slots: np.ndarray,
+    weights: np.ndarray,
+    theo: np.ndarray,
+    n: int,
+) -> Tuple[np.ndarray, float, np.ndarray]:
+    """Slot counts, chi-square and per-slot deviation (%) in a single pass.
+
+    An empty ``weights`` array means every slot entry counts once.
+    Only used when compiled with numba.
+    """
+    counts = np.zeros(16, dtype=np.int64)
+    weighted = weights.size > 0
+    for i in range(slots.size):
+        slot = slots[i]
+        if 0 <= slot < 16:
+            counts[slot] += weights[i] if weighted else 1
+
+    chi_square = 0.0
+    deviation = np.empty(16, dtype=np.float64)
+    for k in range(16):
+        expected = theo[k] * n
+        if expected > 0:
+            chi_square += (counts[k] - expected) ** 2 / expected
+        deviation[k] = counts[k] / n * 100 - theo[k] * 100
+    return counts, chi_square, deviation
+
+
+def _fairness_kernel_numpy(
+    slots: np.ndarray,
+    weights: np.ndarray,
+    theo: np.ndarray,
+    n: int,
+) -> Tuple[np.ndarray, float, np.ndarray]:
+    """NumPy equivalent of ``_fairness_kernel_loop``."""
+    in_range = (slots >= 0) & (slots < 16)
+    if weights.size:
+        counts = np.bincount(slots[in_range], weights=weights[in_range], minlength=16)
+        counts = counts.astype(np.int64)
+    else:
+        counts = np.bincount(slots[in_range], minlength=16)
+
+    expected = theo * n
+    chi_square = float(
+        np.divide(
+            (counts - expected) ** 2, expected,
+            out=np.zeros(16), where=expected > 0,
+        ).sum()
+    )
+    deviation = counts / n * 100 - theo * 100
+    return counts, chi_square, deviation
+
+
+def _mean(values: np.ndarray, weights: Optional[np.ndarray] = None) -> float:
+    """(Weighted) mean accumulated in float64 regardless of the column dtype."""
+    if weights is None:
+        return float(values.mean(dtype=np.float64))
+    return float(np.average(values.astype(np.float64), weights=weights))
+
+
+if njit is not None:
+    _fairness_kernel = njit(cache=True, fastmath=True)(_fairness_kernel_loop)
+else:
+    _fairness_kernel = _fairness_kernel_numpy
+
+_NO_WEIGHTS = np.empty(0, dtype=np.int64)
+
+
 class PlinkoCalculator:
     """Calculates Plinko-specific statistics."""
 
+    @staticmethod
+    def _to_columns(drops: List[Dict]) -> DropColumns:
+        """Split a list of drop rows into (slots, multipliers, created_at) columns.
+
+        Done once per risk level so every calculator method reads plain
+        arrays instead of re-walking the row dicts.
+        """
+        n = len(drops)
+        slots = np.fromiter(
+            (d.get('slot', d.get('landing_slot', 7)) for d in drops),
+            dtype=SLOT_DTYPE, count=n,
+        )
+        mults = np.fromiter(
+            (d.get('multiplier', 1.0) for d in drops),
+            dtype=MULT_DTYPE, count=n,
+        )
+        created_at = np.array([d.get('created_at') for d in drops], dtype=object)
+        return slots, mults, created_at
+
+    @staticmethod
+    def _slot_counts(
+        slots: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Hit count per slot; out-of-range slots are ignored.
+
+        ``weights`` gives the number of drops each entry stands for when the
+        columns come from a pre-aggregated histogram.
+        """
+        in_range = (slots >= 0) & (slots < 16)
+        if weights is None:
+            return np.bincount(slots[in_range], minlength=16)
+        return np.bincount(
+            slots[in_range], weights=weights[in_range], minlength=16,
+        ).astype(np.int64)
+
+    @staticmethod
+    def _weighted_median(values: np.ndarray, weights: np.ndarray) -> float:
+        """Median of ``values`` repeated ``weights`` times, without repeating them."""
+        order = np.argsort(values, kind='stable')
+        cum = np.cumsum(weights[order])
+        total = int(cum[-1])
+        lo, hi = np.searchsorted(cum, [(total - 1) // 2, total // 2], side='right')
+        return float(values[order[lo]] + values[order[hi]]) / 2
+
     def analyze_slot_distribution(
         self,
         drops: List[Dict],
         risk_level: str,
     ) -> SlotDistribution:
         """Analyze slot distribution for a risk level."""
-        if not drops:
-            return SlotDistribution(
-                total_drops=0,
-                risk_level=risk_level,
-                slots=[],
-                most_hit_slot=7,
-                least_hit_slot=0,
-                avg_multiplier=1.0,
-                edge_rate=0,
-                center_rate=0,
-                jackpot_rate=0,
-            )
-
-        slot_counts = {i: 0 for i in range(16)}
-        multipliers = []
-
-        for drop in drops:
-            slot = drop.get('slot', drop.get('landing_slot', 7))
-            mult = drop.get('multiplier', 1.0)
-            if 0 <= slot < 16:
-                slot_counts[slot] += 1
-            multipliers.append(mult)
+        slots, mults, _ = self._to_columns(drops)
+        return self.analyze_slot_distribution_arr(slots, mults, risk_level)
 
-        n = len(drops)
-        slot_mults = PLINKO_SLOTS.get(risk_level, PLINKO_SLOTS['medium'])
-
-        # Build slot stats
-        slots = []
-        for slot_id in range(16):
-            count = slot_counts[slot_id]
-            pct = count / n * 100 if n > 0 else 0
-            theo_pct = THEORETICAL_DISTRIBUTION.get(slot_id, 0.0625) * 100
-            deviation = pct - theo_pct
-
-            slots.append(SlotStats(
+    def analyze_slot_distribution_arr(
+        self,
+        slots_arr: np.ndarray,
+        mults: np.ndarray,
+        risk_level: str,
+        weights: Optional[np.ndarray] = None,
+    ) -> SlotDistribution:
+        """Analyze slot distribution from pre-extracted (optionally weighted) columns."""
+        if not slots_arr.size:
+            empty = _EMPTY_SLOT_DISTRIBUTION_BY_RISK.get(risk_level)
+            return empty if empty is not None else _empty_slot_distribution(risk_level)
+
+        n = slots_arr.size if weights is None else int(weights.sum())
+        counts = self._slot_counts(slots_arr, weights)
+        slot_mults = PLINKO_SLOT_ARR[RISK_IDX.get(risk_level, 1)]
+
+        pct = counts / n * 100
+        theo_pct = THEO_ARR * 100
+        deviation = pct - theo_pct
+
+        # Build slot stats (rounded column-wise before model construction)
+        slots = [
+            SlotStats(
                 slot_id=slot_id,
-                multiplier=slot_mults.get(slot_id, 1.0),
+                multiplier=mult,
                 hit_count=count,
-                percentage=round(pct, 2),
-                theoretical_percentage=round(theo_pct, 2),
-                deviation=round(deviation, 2),
+                percentage=p,
+                theoretical_percentage=theo,
+                deviation=dev,
+            )
+            for slot_id, (mult, count, p, theo, dev) in enumerate(zip(
+                slot_mults.tolist(), counts.tolist(), np.round(pct, 2).tolist(),
+                np.round(theo_pct, 2).tolist(), np.round(deviation, 2).tolist(),
             ))
+        ]
 
-        # Find most/least hit
-        sorted_slots = sorted(slot_counts.items(), key=lambda x: x[1], reverse=True)
-        most_hit = sorted_slots[0][0]
-        least_hit = sorted_slots[-1][0]
+        # Find most/least hit (ties: lowest slot for most, highest for least)
+        most_hit = int(counts.argmax())
+        least_hit = 15 - int(counts[::-1].argmin())
 
         # Edge vs center
-        edge_slots = [0, 1, 2, 13, 14, 15]
-        center_slots = [6, 7, 8, 9]
-        edge_rate = sum(slot_counts[s] for s in edge_slots) / n * 100 if n > 0 else 0
-        center_rate = sum(slot_counts[s] for s in center_slots) / n * 100 if n > 0 else 0
+        edge_rate = counts[[0, 1, 2, 13, 14, 15]].sum() / n * 100
+        center_rate = counts[[6, 7, 8, 9]].sum() / n * 100
 
         # Jackpot rate (slots 7 and 8)
-        jackpot_rate = (slot_counts[7] + slot_counts[8]) / n * 100 if n > 0 else 0
+        jackpot_rate = (counts[7] + counts[8]) / n * 100
 
         return SlotDistribution(
             total_drops=n,
@@ -238,10 +458,10 @@ class PlinkoCalculator:
             slots=slots,
             most_hit_slot=most_hit,
             least_hit_slot=least_hit,
-            avg_multiplier=round(statistics.mean(multipliers), 4) if multipliers else 1.0,
-            edge_rate=round(edge_rate, 2),
-            center_rate=round(center_rate, 2),
-            jackpot_rate=round(jackpot_rate, 4),
+            avg_multiplier=round(_mean(mults, weights), 4),
+            edge_rate=round(float(edge_rate), 2),
+            center_rate=round(float(center_rate), 2),
+            jackpot_rate=round(float(jackpot_rate), 4),
         )
 
     def compare_risk_levels(
@@ -249,36 +469,56 @@ class PlinkoCalculator:
         all_drops: Dict[str, List[Dict]],
     ) -> List[RiskLevelComparison]:
         """Compare statistics across risk levels."""
+        return self.compare_risk_levels_arr({
+            risk_level: self._to_columns(drops)[1]
+            for risk_level, drops in all_drops.items()
+        })
+
+    def compare_risk_levels_arr(
+        self,
+        all_mults: Dict[str, np.ndarray],
+        all_weights: Optional[Dict[str, np.ndarray]] = None,
+    ) -> List[RiskLevelComparison]:
+        """Compare risk levels from per-level (optionally weighted) multiplier arrays."""
         results = []
 
-        for risk_level, drops in all_drops.items():
-            if not drops:
+        for risk_level, m in all_mults.items():
+            if not m.size:
                 continue
 
-            multipliers = [d.get('multiplier', 1.0) for d in drops]
-            n = len(multipliers)
+            w = all_weights[risk_level] if all_weights is not None else None
+            n = m.size if w is None else int(w.sum())
 
-            # Win distribution
-            loss = sum(1 for m in multipliers if m < 1.0) / n * 100
-            small = sum(1 for m in multipliers if 1.0 <= m < 2.0) / n * 100
-            medium = sum(1 for m in multipliers if 2.0 <= m < 10.0) / n * 100
-            big = sum(1 for m in multipliers if m >= 10.0) / n * 100
+            # Win distribution and jackpot hits from a single histogram pass:
+            # loss (<1x), small (1-2x), medium (2-10x), big (10x+), and the
+            # bins at or above this risk level's max multiplier
+            risk_idx = RISK_IDX.get(risk_level, 1)
+            max_mult = PLINKO_MAX[risk_idx]
+            edges, bin_bucket, jackpot_bins = WIN_BINS[risk_idx]
+            idx = np.searchsorted(edges.astype(m.dtype), m, side='right')
+            bin_counts = np.bincount(idx, weights=w, minlength=edges.size + 1)
 
-            # Get max multiplier for this risk level
-            slot_mults = PLINKO_SLOTS.get(risk_level, PLINKO_SLOTS['medium'])
-            max_mult = max(slot_mults.values())
-            jackpot = sum(1 for m in multipliers if m >= max_mult) / n * 100
+            bucket_counts = np.bincount(bin_bucket, weights=bin_counts, minlength=4)
+            loss, small, medium, big = (bucket_counts / n * 100).tolist()
+            jackpot = float(bin_counts[jackpot_bins].sum()) / n * 100
 
             # Actual RTP
-            avg_mult = statistics.mean(multipliers)
+            avg_mult = _mean(m, w)
             actual_rtp = avg_mult * 100  # Simplified RTP calculation
 
+            if w is None:
+                median = float(np.median(m))
+                std = float(m.std(ddof=1, dtype=np.float64)) if n > 1 else 0
+            else:
+                median = self._weighted_median(m, w)
+                std = float(np.sqrt((w * (m - avg_mult) ** 2).sum() / (n - 1))) if n > 1 else 0
+
             results.append(RiskLevelComparison(
                 risk_level=risk_level,
                 total_drops=n,
                 avg_multiplier=round(avg_mult, 4),
-                median_multiplier=round(statistics.median(multipliers), 4),
-                std_deviation=round(statistics.stdev(multipliers), 4) if n > 1 else 0,
+                median_multiplier=round(median, 4),
+                std_deviation=round(std, 4),
                 rtp_actual=round(actual_rtp, 2),
                 loss_rate=round(loss, 2),
                 small_win_rate=round(small, 2),
@@ -296,58 +536,49 @@ class PlinkoCalculator:
         risk_level: str,
     ) -> TheoreticalVsActual:
         """Compare theoretical vs actual distribution."""
-        slot_counts = {i: 0 for i in range(16)}
-
-        for drop in drops:
-            slot = drop.get('slot', drop.get('landing_slot', 7))
-            if 0 <= slot < 16:
-                slot_counts[slot] += 1
+        slots, _, _ = self._to_columns(drops)
+        return self.analyze_fairness_arr(slots, risk_level)
 
-        n = len(drops)
+    def analyze_fairness_arr(
+        self,
+        slots: np.ndarray,
+        risk_level: str,
+        weights: Optional[np.ndarray] = None,
+    ) -> TheoreticalVsActual:
+        """Compare theoretical vs actual distribution from a (weighted) slot array."""
+        n = slots.size if weights is None else int(weights.sum())
         if n == 0:
-            return TheoreticalVsActual(
-                risk_level=risk_level,
-                chi_square_score=0,
-                deviation_score=0,
-                is_fair=True,
-                slot_comparisons=[],
-                overperforming_slots=[],
-                underperforming_slots=[],
-            )
+            empty = _EMPTY_FAIRNESS_BY_RISK.get(risk_level)
+            return empty if empty is not None else _empty_fairness(risk_level)
 
-        # Chi-square calculation
-        chi_square = 0
-        comparisons = []
-        overperforming = []
-        underperforming = []
-
-        for slot_id in range(16):
-            observed = slot_counts[slot_id]
-            expected = THEORETICAL_DISTRIBUTION.get(slot_id, 0.0625) * n
-
-            if expected > 0:
-                chi_square += ((observed - expected) ** 2) / expected
-
-            actual_pct = observed / n * 100
-            theo_pct = THEORETICAL_DISTRIBUTION.get(slot_id, 0.0625) * 100
-            deviation = actual_pct - theo_pct
-
-            comparisons.append({
-                "slot": slot_id,
-                "observed": observed,
-                "expected": round(expected, 2),
-                "actual_pct": round(actual_pct, 2),
-                "theoretical_pct": round(theo_pct, 2),
-                "deviation": round(deviation, 2),
-            })
-
-            if deviation > 1.0:  # More than 1% over
-                overperforming.append(slot_id)
-            elif deviation < -1.0:  # More than 1% under
-                underperforming.append(slot_id)
+        counts, chi_square, deviation = _fairness_kernel(
+            slots, _NO_WEIGHTS if weights is None else weights, THEO_ARR, n,
+        )
+        observed = counts.astype(np.float64)
+        expected = THEO_ARR * n
+        actual_pct = observed / n * 100
+        theo_pct = THEO_ARR * 100
+
+        overperforming = np.flatnonzero(deviation > 1.0).tolist()  # More than 1% over
+        underperforming = np.flatnonzero(deviation < -1.0).tolist()  # More than 1% under
+
+        # Finish all arithmetic column-wise, then zip the columns into the
+        # per-slot dicts in one go
+        deviation_r = np.round(deviation, 2)
+        comparisons = [
+            dict(zip(SLOT_COMPARISON_KEYS, row))
+            for row in zip(
+                range(16),
+                counts.tolist(),
+                np.round(expected, 2).tolist(),
+                np.round(actual_pct, 2).tolist(),
+                np.round(theo_pct, 2).tolist(),
+                deviation_r.tolist(),
+            )
+        ]
 
         # Deviation score (0-1, lower is better)
-        total_deviation = sum(abs(c["deviation"]) for c in comparisons)
+        total_deviation = float(np.abs(deviation_r).sum())
         deviation_score = min(total_deviation / 100, 1.0)
 
         # Fairness test (chi-square critical value for df=15 at 95% is ~25)
@@ -369,31 +600,40 @@ class PlinkoCalculator:
         risk_level: str = "high",
     ) -> JackpotTracker:
         """Track jackpot occurrences."""
-        slot_mults = PLINKO_SLOTS.get(risk_level, PLINKO_SLOTS['high'])
-        max_mult = max(slot_mults.values())
+        _, mults, created_at = self._to_columns(drops)
+        return self.track_jackpots_arr(mults, created_at, risk_level)
 
-        jackpot_indices = []
-        for i, drop in enumerate(drops):
-            mult = drop.get('multiplier', 1.0)
-            if mult >= max_mult:
-                jackpot_indices.append(i)
+    def track_jackpots_arr(
+        self,
+        mults: np.ndarray,
+        created_at: np.ndarray,
+        risk_level: str = "high",
+    ) -> JackpotTracker:
+        """Track jackpot occurrences from multiplier/timestamp columns."""
+        if not mults.size:
+            return _EMPTY_JACKPOT
 
-        total = len(jackpot_indices)
-        drops_since = jackpot_indices[0] if jackpot_indices else len(drops)
+        max_mult = PLINKO_MAX[RISK_IDX.get(risk_level, 2)]
+
+        # Drops are newest-first, so the first index is the latest jackpot
+        jackpot_indices = np.flatnonzero(mults >= mults.dtype.type(max_mult))
+
+        total = int(jackpot_indices.size)
+        drops_since = int(jackpot_indices[0]) if total else int(mults.size)
 
         # Last jackpot time
         last_time = None
-        if jackpot_indices and 'created_at' in drops[jackpot_indices[0]]:
-            last_time = drops[jackpot_indices[0]]['created_at']
+        if total:
+            last_time = created_at[jackpot_indices[0]]
+            if isinstance(last_time, np.datetime64):
+                last_time = None if np.isnat(last_time) else last_time.astype('datetime64[us]').item()
 
         # Average between jackpots
         avg_between = None
-        if len(jackpot_indices) > 1:
-            gaps = [jackpot_indices[i] - jackpot_indices[i+1] for i in range(len(jackpot_indices)-1)]
-            avg_between = statistics.mean(gaps)
+        if total > 1:
+            avg_between = float(np.diff(jackpot_indices).mean())
 
-        # Theoretical probability (roughly 0.3% for high risk jackpot)
-        theo_prob = 0.3
+        theo_prob = JACKPOT_PROBABILITY
         expected_drops = int(100 / theo_prob)  # ~333 drops
 
         # Is current drought longer than expected?
@@ -409,6 +649,44 @@ class PlinkoCalculator:
         )
 
 
+# =============================================================================
+# SQL
+# =============================================================================
+
+def _window_filter(by_time: bool, by_risk: bool) -> str:
+    """WHERE clause for an optional time window and risk level."""
+    clause = " WHERE 1=1"
+    if by_time:
+        clause += " AND created_at >= ?"
+    if by_risk:
+        clause += " AND risk_level = ?"
+    return clause
+
+
+# get_drops_arrays statements, keyed by (by_time, by_risk). created_at is
+# epoch milliseconds and risk_level the risk_levels id
+DROP_COLUMN_QUERIES: Dict[Tuple[bool, bool], str] = {
+    (by_time, by_risk): (
+        "SELECT landing_position, multiplier, created_at FROM plinko_rounds"
+        + _window_filter(by_time, by_risk) + " ORDER BY created_at DESC"
+    )
+    for by_time in (False, True)
+    for by_risk in (False, True)
+}
+
+# The unary + stops the planner from walking all of idx_risk_created just to
+# get rows in risk_level order; seeking the window on idx_created_id and
+# grouping in a temp b-tree is far cheaper
+SLOT_HISTOGRAM_QUERY = (
+    "SELECT risk_level, landing_position AS slot, multiplier, COUNT(*) AS hits"
+    " FROM plinko_rounds{where} GROUP BY +risk_level, landing_position, multiplier"
+)
+SLOT_HISTOGRAM_QUERIES: Dict[bool, str] = {
+    False: SLOT_HISTOGRAM_QUERY.format(where=""),
+    True: SLOT_HISTOGRAM_QUERY.format(where=" WHERE created_at >= ?"),
+}
+
+
 # =============================================================================
 # Service
 # =============================================================================
@@ -416,73 +694,170 @@ class PlinkoCalculator:
 class PlinkoStatsService:
     """Service for Plinko statistics."""
 
-    def __init__(self, db_pool):
-        self.db_pool = db_pool
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
         self.calculator = PlinkoCalculator()
+        # period -> (expires_at monotonic time, statistics)
+        self._stats_cache: Dict[str, Tuple[float, PlinkoStatistics]] = {}
+        # period -> lock held while that period is being recomputed
+        self._stats_locks: Dict[str, asyncio.Lock] = {}
+
+    @staticmethod
+    def _window_params(hours: Optional[int], risk_level: Optional[str]) -> List[Any]:
+        """Bound parameters for _window_filter: epoch-ms window start, risk level id."""
+        params: List[Any] = []
+        if hours:
+            params.append(int((time.time() - hours * 3600) * 1000))
+        if risk_level:
+            params.append(RISK_IDX[risk_level])
+        return params
 
-    async def get_drops(
+    async def get_drops_arrays(
         self,
         hours: Optional[int] = None,
         risk_level: Optional[str] = None,
-        limit: Optional[int] = None,
-    ) -> List[Dict]:
-        """Fetch Plinko drops from database."""
-        query = "SELECT * FROM rounds WHERE 1=1"
-        params = []
-
-        if hours:
-            cutoff = datetime.utcnow() - timedelta(hours=hours)
-            query += " AND created_at >= ?"
-            params.append(cutoff)
-
-        if risk_level:
-            query += " AND risk_level = ?"
-            params.append(risk_level)
-
-        query += " ORDER BY created_at DESC"
-
-        if limit:
-            query += f" LIMIT {limit}"
+    ) -> DropColumns:
+        """Fetch drops straight into (slots, multipliers, created_at) arrays.
+
+        The window is read by a single SELECT, so it comes from one
+        snapshot. Rows are pulled DROP_FETCH_SIZE at a time and each batch
+        is converted to array chunks at once, so no per-row Python object
+        survives the fetch; the result is sized by the rows actually read.
+        """
+        params = self._window_params(hours, risk_level)
+        query = DROP_COLUMN_QUERIES[(bool(hours), bool(risk_level))]
+
+        slot_chunks: List[np.ndarray] = []
+        mult_chunks: List[np.ndarray] = []
+        created_chunks: List[np.ndarray] = []
+        async with self.db_manager.connect() as conn:
+            async with conn.execute(query, params) as cursor:
+                while True:
+                    rows = await cursor.fetchmany(DROP_FETCH_SIZE)
+                    if not rows:
+                        break
+                    n = len(rows)
+                    slot_chunks.append(np.fromiter((r[0] for r in rows), SLOT_DTYPE, n))
+                    mult_chunks.append(np.fromiter((r[1] for r in rows), MULT_DTYPE, n))
+                    created_chunks.append(np.fromiter((r[2] for r in rows), np.int64, n))
+
+        if not slot_chunks:
+            return (
+                np.empty(0, dtype=SLOT_DTYPE),
+                np.empty(0, dtype=MULT_DTYPE),
+                np.empty(0, dtype='datetime64[ms]'),
+            )
+        return (
+            np.concatenate(slot_chunks),
+            np.concatenate(mult_chunks),
+            np.concatenate(created_chunks).view('datetime64[ms]'),
+        )
 
-        async with self.db_pool.acquire() as conn:
-            rows = await conn.fetch(query, *params)
-            return [dict(row) for row in rows]
+    async def get_slot_histograms(
+        self,
+        hours: Optional[int] = None,
+    ) -> Sequence[Mapping[str, Any]]:
+        """Fetch per (risk level, slot, multiplier) hit counts from the database.
+
+        The aggregation runs in SQL, so the window comes back as at most a
+        few dozen rows per risk level instead of one row per drop.
+        """
+        params = self._window_params(hours, None)
+        query = SLOT_HISTOGRAM_QUERIES[bool(hours)]
+
+        async with self.db_manager.connect() as conn:
+            return await conn.execute_fetchall(query, params)
+
+    @staticmethod
+    def _split_histograms(rows: Sequence[Mapping[str, Any]]) -> Dict[str, HistogramColumns]:
+        """Group histogram rows into (slots, multipliers, hits) columns per risk level."""
+        grouped: Dict[str, List[Mapping[str, Any]]] = {}
+        for row in rows:
+            grouped.setdefault(RISK_LEVELS[row['risk_level']], []).append(row)
+
+        return {
+            risk: (
+                np.array([r['slot'] for r in group], dtype=SLOT_DTYPE),
+                np.array([r['multiplier'] for r in group], dtype=np.float64),
+                np.array([r['hits'] for r in group], dtype=np.int64),
+            )
+            for risk, group in grouped.items()
+        }
 
     async def get_statistics(
         self,
         period: str = "24h",
     ) -> PlinkoStatistics:
-        """Get complete Plinko statistics."""
-        hours_map = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
-        hours = hours_map.get(period, 24)
-
-        # Fetch data by risk level
-        all_drops = {}
-        for risk in ["low", "medium", "high"]:
-            drops = await self.get_drops(hours=hours, risk_level=risk)
-            if drops:
-                all_drops[risk] = drops
-
-        # Also get all drops for overall stats
-        all_data = await self.get_drops(hours=hours)
-
-        # Slot distributions
-        slot_dists = {}
-        fairness = {}
-        for risk, drops in all_drops.items():
-            slot_dists[risk] = self.calculator.analyze_slot_distribution(drops, risk)
-            fairness[risk] = self.calculator.analyze_fairness(drops, risk)
-
-        # Risk comparisons
-        risk_comparisons = self.calculator.compare_risk_levels(all_drops)
-
-        # Jackpot tracking (high risk)
-        high_drops = all_drops.get("high", [])
-        jackpot_tracker = self.calculator.track_jackpots(high_drops, "high")
+        """Get complete Plinko statistics, served from a short TTL cache per period.
+
+        An expired period is recomputed by one request at a time; requests
+        that waited for it reuse the fresh result.
+        """
+        cached = self._stats_cache.get(period)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        if STATS_CACHE_TTL_SECONDS <= 0:
+            return await self._compute_statistics(period)
+
+        lock = self._stats_locks.get(period)
+        if lock is None:
+            lock = self._stats_locks[period] = asyncio.Lock()
+        async with lock:
+            cached = self._stats_cache.get(period)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+            stats = await self._compute_statistics(period)
+            self._stats_cache[period] = (time.monotonic() + STATS_CACHE_TTL_SECONDS, stats)
+            return stats
+
+    async def _compute_statistics(
+        self,
+        period: str,
+    ) -> PlinkoStatistics:
+        """Compute complete Plinko statistics from the database."""
+        hours = HOURS_MAP.get(period, 24)
+
+        # Aggregated histograms cover every statistic except jackpot
+        # tracking, which depends on drop order and needs the raw rows
+        hist_rows, (_, high_mults, high_created) = await asyncio.gather(
+            self.get_slot_histograms(hours=hours),
+            self.get_drops_arrays(hours=hours, risk_level="high"),
+        )
+        histograms = self._split_histograms(hist_rows)
+
+        by_risk = {
+            risk: histograms[risk]
+            for risk in RISK_LEVELS
+            if risk in histograms
+        }
+
+        # The per-risk histograms are only a few dozen bins each, so they
+        # are reduced inline: a hop through the thread pool would cost more
+        calc = self.calculator
+        slot_dists = {
+            risk: calc.analyze_slot_distribution_arr(slots, mults, risk, hits)
+            for risk, (slots, mults, hits) in by_risk.items()
+        }
+        fairness = {
+            risk: calc.analyze_fairness_arr(slots, risk, hits)
+            for risk, (slots, _, hits) in by_risk.items()
+        }
+        risk_comparisons = calc.compare_risk_levels_arr(
+            {risk: mults for risk, (_, mults, _) in by_risk.items()},
+            {risk: hits for risk, (_, _, hits) in by_risk.items()},
+        )
+
+        # Jackpot tracking walks every high-risk drop, so it runs in a worker
+        # thread (NumPy releases the GIL) and keeps the event loop free
+        jackpot_tracker = await asyncio.to_thread(
+            calc.track_jackpots_arr, high_mults, high_created, "high"
+        )
 
         # Overall stats
-        all_multipliers = [d.get('multiplier', 1.0) for d in all_data]
-        overall_avg = statistics.mean(all_multipliers) if all_multipliers else 1.0
+        total_drops = sum(int(hits.sum()) for _, _, hits in histograms.values())
+        total_payout = sum(float(mults @ hits) for _, mults, hits in histograms.values())
+        overall_avg = total_payout / total_drops if total_drops else 1.0
         overall_rtp = overall_avg * 100
 
         return PlinkoStatistics(
@@ -492,7 +867,7 @@ class PlinkoStatsService:
             risk_comparisons=risk_comparisons,
             fairness_analysis=fairness,
             jackpot_tracker=jackpot_tracker,
-            total_drops=len(all_data),
+            total_drops=total_drops,
             overall_avg_multiplier=round(overall_avg, 4),
             overall_rtp=round(overall_rtp, 2),
         )
@@ -502,79 +877,95 @@ class PlinkoStatsService:
 # Router Factory
 # =============================================================================
 
-def create_plinko_router(db_pool) -> APIRouter:
-    """Create router for Plinko statistics."""
-    router = APIRouter(prefix="/api/v2/plinko", tags=["plinko-stats"])
-    service = PlinkoStatsService(db_pool)
+def _model_response(content: Union[BaseModel, Sequence[BaseModel]]) -> ORJSONResponse:
+    """Serialize already-built response models once, skipping response validation."""
+    if isinstance(content, BaseModel):
+        return ORJSONResponse(content.model_dump(mode="json"))
+    return ORJSONResponse([item.model_dump(mode="json") for item in content])
+
+
+def create_plinko_router(db_manager) -> APIRouter:
+    """Create router for Plinko statistics, reading through the API's DatabaseManager."""
+    router = APIRouter(
+        prefix="/api/v2/plinko",
+        tags=["plinko-stats"],
+        default_response_class=ORJSONResponse,
+    )
+    service = PlinkoStatsService(db_manager)
 
     @router.get(
         "",
-        response_model=PlinkoStatistics,
+        response_model=None,
+        responses={200: {"model": PlinkoStatistics}},
         summary="Get Plinko Statistics",
     )
     async def get_plinko_stats(
         period: str = Query("24h", regex="^(1h|6h|24h|7d|30d)$"),
     ):
-        return await service.get_statistics(period)
+        return _model_response(await service.get_statistics(period))
 
     @router.get(
         "/slots/{risk_level}",
-        response_model=SlotDistribution,
+        response_model=None,
+        responses={200: {"model": SlotDistribution}},
         summary="Get Slot Distribution",
     )
     async def get_slot_distribution(
         risk_level: PlinkoRiskLevel,
         period: str = Query("24h"),
     ):
-        hours_map = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
-        hours = hours_map.get(period, 24)
-        drops = await service.get_drops(hours=hours, risk_level=risk_level.value)
-        return service.calculator.analyze_slot_distribution(drops, risk_level.value)
+        hours = HOURS_MAP.get(period, 24)
+        slots, mults, _ = await service.get_drops_arrays(hours=hours, risk_level=risk_level.value)
+        return _model_response(
+            service.calculator.analyze_slot_distribution_arr(slots, mults, risk_level.value)
+        )
 
     @router.get(
         "/fairness/{risk_level}",
-        response_model=TheoreticalVsActual,
+        response_model=None,
+        responses={200: {"model": TheoreticalVsActual}},
         summary="Get Fairness Analysis",
     )
     async def get_fairness_analysis(
         risk_level: PlinkoRiskLevel,
         period: str = Query("7d"),
     ):
-        hours_map = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
-        hours = hours_map.get(period, 168)
-        drops = await service.get_drops(hours=hours, risk_level=risk_level.value)
-        return service.calculator.analyze_fairness(drops, risk_level.value)
+        hours = HOURS_MAP.get(period, 168)
+        slots, _, _ = await service.get_drops_arrays(hours=hours, risk_level=risk_level.value)
+        return _model_response(service.calculator.analyze_fairness_arr(slots, risk_level.value))
 
     @router.get(
         "/jackpot",
-        response_model=JackpotTracker,
+        response_model=None,
+        responses={200: {"model": JackpotTracker}},
         summary="Get Jackpot Tracker",
     )
     async def get_jackpot_tracker(
         period: str = Query("30d"),
     ):
-        hours_map = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
-        hours = hours_map.get(period, 720)
-        drops = await service.get_drops(hours=hours, risk_level="high")
-        return service.calculator.track_jackpots(drops, "high")
+        hours = HOURS_MAP.get(period, 720)
+        _, mults, created_at = await service.get_drops_arrays(hours=hours, risk_level="high")
+        return _model_response(service.calculator.track_jackpots_arr(mults, created_at, "high"))
 
     @router.get(
         "/risk-comparison",
-        response_model=List[RiskLevelComparison],
+        response_model=None,
+        responses={200: {"model": List[RiskLevelComparison]}},
         summary="Get Risk Level Comparison",
     )
     async def get_risk_comparison(
         period: str = Query("7d"),
     ):
-        hours_map = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
-        hours = hours_map.get(period, 168)
+        hours = HOURS_MAP.get(period, 168)
 
-        all_drops = {}
-        for risk in ["low", "medium", "high"]:
-            drops = await service.get_drops(hours=hours, risk_level=risk)
-            if drops:
-                all_drops[risk] = drops
+        # Risk comparisons only need per-multiplier hit counts, so the
+        # aggregated histogram avoids pulling the window's rows
+        histograms = service._split_histograms(await service.get_slot_histograms(hours=hours))
+        by_risk = {risk: histograms[risk] for risk in RISK_LEVELS if risk in histograms}
 
-        return service.calculator.compare_risk_levels(all_drops)
+        return _model_response(service.calculator.compare_risk_levels_arr(
+            {risk: mults for risk, (_, mults, _) in by_risk.items()},
+            {risk: hits for risk, (_, _, hits) in by_risk.items()},
+        ))
 
     return router
@@ -9,18 +9,29 @@ Author: Crash Games Team
 Version: 1.0.0
 """
 
+import asyncio
 import logging
 import os
+import re
+import sqlite3
+import sys
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 import aiosqlite
 from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
+# The schema module is shared with the collector and lives in backend/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from plinko_schema import SCHEMA_VERSION, create_if_missing_path
+
 # Game-specific statistics
 from game_stats import create_plinko_router
 
@@ -29,6 +40,10 @@ from game_stats import create_plinko_router
 # Logging Configuration
 # =============================================================================
 
+# Request handlers log at INFO/DEBUG; keep them quiet unless asked for
+LOG_LEVEL: str = os.getenv("LOG_LEVEL", "WARNING").upper()
+
+
 def setup_logger(name: str) -> logging.Logger:
     """
     Configure and return a logger with structured formatting.
@@ -50,7 +65,7 @@ def setup_logger(name: str) -> logging.Logger:
         )
         handler.setFormatter(formatter)
         logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
+        logger.setLevel(LOG_LEVEL)
     return logger
 
 
@@ -64,6 +79,30 @@ logger = setup_logger(__name__)
 # Database path from environment variable with default fallback
 DATABASE_PATH: str = os.getenv("DATABASE_PATH", "plinko.db")
 
+# PRAGMAs applied once to the shared API connection: WAL lets the API read
+# while the collector writes, and the larger cache/mmap keep hot pages around
+SQLITE_PRAGMAS: List[str] = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+]
+
+# How long aggregate responses (summary, recent, distribution) are reused.
+# The collector only appends, so a short TTL absorbs request bursts while
+# keeping the numbers fresh (0 disables caching)
+AGG_CACHE_TTL_SECONDS: float = float(os.getenv("AGG_CACHE_TTL_SECONDS", "2"))
+
+# Whether the API compresses responses itself
+GZIP_ENABLED: bool = os.getenv("GZIP_ENABLED", "true").lower() == "true"
+
+# Health probes reuse their response for this long
+HEALTH_CACHE_TTL_SECONDS: float = 1.0
+
+# How often the background task refreshes last_data_update for /api/health
+LAST_UPDATE_REFRESH_SECONDS: float = 60.0
+
 # CORS allowed origins - configurable via environment
 ALLOWED_ORIGINS: List[str] = [
     "http://localhost:3000",
@@ -72,6 +111,13 @@ ALLOWED_ORIGINS: List[str] = [
     os.getenv("SECONDARY_DOMAIN", "https://www.plinkotracker.com"),
 ]
 
+# Headers for OPTIONS requests that are not CORS preflights (those are
+# answered by CORSMiddleware before routing)
+OPTIONS_HEADERS: Dict[str, str] = {
+    "Allow": "GET, HEAD, OPTIONS",
+    "Cache-Control": "max-age=86400",
+}
+
 # Constants for multiplier distribution buckets
 DISTRIBUTION_BUCKETS: List[tuple] = [
     ("instant", "= 1"),
@@ -85,6 +131,95 @@ DISTRIBUTION_BUCKETS: List[tuple] = [
     ("100x+", ">= 100.01"),
 ]
 
+# Leading column order of the /api/drops SELECT, used to build response items
+# directly (zip stops before the trailing cursor columns)
+DROP_FIELDS: Tuple[str, ...] = (
+    "drop_id", "risk_level", "rows", "landing_position", "multiplier", "created_at"
+)
+
+# Buckets are disjoint, so one CASE pass assigns each drop to at most one of
+# them; drops outside every bucket land in the NULL group but still count
+# towards the total
+DISTRIBUTION_SQL: str = (
+    "SELECT bucket, COUNT(*) FROM (SELECT CASE "
+    + " ".join(
+        f"WHEN multiplier {condition} THEN '{name}'"
+        for name, condition in DISTRIBUTION_BUCKETS
+    )
+    + " END AS bucket FROM plinko_rounds) GROUP BY bucket"
+)
+
+# Fixed read queries, kept as module constants so every request submits the
+# same SQL text and hits the connection's prepared-statement cache
+DROPS_TOTAL_SQL: str = "SELECT v FROM plinko_meta WHERE k = 'drops_total'"
+
+# Trailing created_at/id columns feed next_cursor. CROSS JOIN pins
+# plinko_rounds as the outer loop so the page is still walked off
+# idx_created_id, with one primary-key lookup per row for the risk name
+DROPS_PAGE_SQL: str = """
+    SELECT p.drop_id, r.name, p.rows, p.landing_position, p.multiplier,
+           strftime('%Y-%m-%dT%H:%M:%S', p.created_at / 1000, 'unixepoch') AS created_iso,
+           p.created_at, p.id
+    FROM plinko_rounds p CROSS JOIN risk_levels r ON r.id = p.risk_level
+    ORDER BY p.created_at DESC, p.id DESC
+    LIMIT ? OFFSET ?
+"""
+
+DROPS_AFTER_CURSOR_SQL: str = """
+    SELECT p.drop_id, r.name, p.rows, p.landing_position, p.multiplier,
+           strftime('%Y-%m-%dT%H:%M:%S', p.created_at / 1000, 'unixepoch') AS created_iso,
+           p.created_at, p.id
+    FROM plinko_rounds p CROSS JOIN risk_levels r ON r.id = p.risk_level
+    WHERE (p.created_at, p.id) < (?, ?)
+    ORDER BY p.created_at DESC, p.id DESC
+    LIMIT ?
+"""
+
+SUMMARY_SQL: str = """
+    SELECT
+        COUNT(*) as total,
+        AVG(multiplier) as avg,
+        MAX(multiplier) as max,
+        MIN(multiplier) as min,
+        SUM(CASE WHEN multiplier < 2 THEN 1 ELSE 0 END) as under_2x,
+        SUM(CASE WHEN multiplier >= 10 THEN 1 ELSE 0 END) as over_10x,
+        (
+            SELECT multiplier FROM plinko_rounds
+            ORDER BY multiplier
+            LIMIT 1 OFFSET (SELECT COUNT(*) FROM plinko_rounds) / 2
+        ) as median
+    FROM plinko_rounds
+"""
+
+RECENT_SQL: str = """
+    SELECT
+        AVG(multiplier) as avg_multiplier,
+        SUM(CASE WHEN multiplier < 2 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as under_2x_pct
+    FROM (
+        SELECT multiplier
+        FROM plinko_rounds
+        ORDER BY created_at DESC
+        LIMIT ?
+    )
+"""
+
+LAST_UPDATE_SQL: str = (
+    "SELECT strftime('%Y-%m-%d %H:%M:%S', MAX(created_at) / 1000, 'unixepoch')"
+    " FROM plinko_rounds"
+)
+
+# /api/drops cursor: "<created_at ms>|<id>". Each part must fit SQLite's
+# signed 64-bit INTEGER, or binding it raises OverflowError
+DROPS_CURSOR_RE: "re.Pattern[str]" = re.compile(r"([0-9]{1,19})\|([0-9]{1,19})")
+SQLITE_MAX_INTEGER: int = 2 ** 63 - 1
+
+# Size of sqlite3's per-connection prepared-statement LRU
+SQLITE_CACHED_STATEMENTS: int = 256
+
+# How long an inline read on the event loop waits for a lock (for example
+# during a WAL checkpoint) before the read is retried through aiosqlite
+READER_BUSY_TIMEOUT_SECONDS: float = 0.1
+
 
 # =============================================================================
 # Pydantic Models
@@ -117,9 +252,13 @@ class DropsResponse(BaseModel):
     Attributes:
         items: List of Drop objects.
         total: Total number of drops in the database.
+        next_cursor: Cursor for the following page, or None on the last page.
     """
     items: List[Drop] = Field(..., description="List of Plinko drops")
     total: int = Field(..., ge=0, description="Total number of drops")
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as ?cursor= to fetch the next page"
+    )
 
 
 class SummaryStats(BaseModel):
@@ -210,10 +349,15 @@ class ErrorResponse(BaseModel):
 
 class DatabaseManager:
     """
-    Manages database connections using context managers for proper cleanup.
+    Manages the shared, long-lived database connections.
 
-    This class provides async context manager for database connections,
-    ensuring connections are properly closed after use.
+    A single aiosqlite connection is opened once (at startup) and reused by
+    every request, so SQLite's page cache stays warm and no request pays
+    for opening the file, attaching the WAL or spawning a worker thread.
+
+    A second, synchronous read-only connection serves short index-bounded
+    reads directly on the event loop, where handing the query to
+    aiosqlite's worker thread costs more than running it.
     """
 
     def __init__(self, db_path: str) -> None:
@@ -224,34 +368,118 @@ class DatabaseManager:
             db_path: Path to the SQLite database file.
         """
         self.db_path = db_path
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._reader: Optional[sqlite3.Connection] = None
+        self._open_lock = asyncio.Lock()
+
+    async def open(self) -> aiosqlite.Connection:
+        """
+        Open the shared connection if needed and return it.
+
+        Returns:
+            aiosqlite.Connection: Shared connection with Row factory and PRAGMAs set.
+        """
+        if self._conn is None:
+            async with self._open_lock:
+                if self._conn is None:
+                    conn = await aiosqlite.connect(
+                        self.db_path,
+                        isolation_level=None,
+                        cached_statements=SQLITE_CACHED_STATEMENTS,
+                    )
+                    conn.row_factory = aiosqlite.Row
+                    for pragma in SQLITE_PRAGMAS:
+                        await conn.execute(pragma)
+                    self._conn = conn
+                    logger.info("Database connection established to %s", self.db_path)
+        return self._conn
+
+    def reader(self) -> sqlite3.Connection:
+        """
+        Return the synchronous read-only connection, opening it if needed.
+
+        Only use it for queries bounded by an index (point lookups, short
+        range seeks); full scans belong on the aiosqlite connection. Prefer
+        read(), which falls back to aiosqlite when the database is busy.
+
+        Returns:
+            sqlite3.Connection: Read-only connection with PRAGMAs set.
+
+        Raises:
+            sqlite3.OperationalError: If the database stays locked for
+                READER_BUSY_TIMEOUT_SECONDS while the connection is set up.
+        """
+        if self._reader is None:
+            # Always used from the event loop thread, but the loop thread may
+            # differ from the one that first opened the connection
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=READER_BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=SQLITE_CACHED_STATEMENTS,
+            )
+            try:
+                for pragma in SQLITE_PRAGMAS:
+                    conn.execute(pragma)
+                conn.execute("PRAGMA query_only=ON")
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._reader = conn
+        return self._reader
+
+    async def read(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Any]:
+        """
+        Run a short, index-bounded read inline on the event loop.
+
+        The reader gives up after READER_BUSY_TIMEOUT_SECONDS if the database
+        is locked, and the read is then retried on the aiosqlite connection,
+        so a busy database never stalls the event loop for long.
+
+        Args:
+            sql: Query bounded by an index.
+            params: Query parameters.
+
+        Returns:
+            List[Any]: Result rows.
+        """
+        try:
+            return self.reader().execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.debug("Inline read failed (%s), retrying through aiosqlite", e)
+        conn = await self.open()
+        return list(await conn.execute_fetchall(sql, params))
+
+    async def close(self) -> None:
+        """Close the shared connections."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+            logger.info("Database connection closed")
 
     @asynccontextmanager
     async def connect(self) -> AsyncGenerator[aiosqlite.Connection, None]:
         """
-        Get a database connection using async context manager.
+        Get the shared database connection using async context manager.
 
         Yields:
             aiosqlite.Connection: Database connection with Row factory set.
 
         Raises:
-            DatabaseError: If connection cannot be established.
+            HTTPException: 503 if the connection cannot be established.
         """
-        db: Optional[aiosqlite.Connection] = None
         try:
-            db = await aiosqlite.connect(self.db_path)
-            db.row_factory = aiosqlite.Row
-            logger.debug(f"Database connection established to {self.db_path}")
-            yield db
+            yield await self.open()
         except aiosqlite.Error as e:
-            logger.error(f"Database connection error: {e}")
+            logger.error("Database connection error: %s", e)
             raise HTTPException(
                 status_code=503,
                 detail="Database connection failed"
             ) from e
-        finally:
-            if db:
-                await db.close()
-                logger.debug("Database connection closed")
 
 
 # Create singleton database manager
@@ -268,12 +496,120 @@ async def get_db() -> AsyncGenerator[aiosqlite.Connection, None]:
     Example:
         @app.get("/api/data")
         async def get_data(db: aiosqlite.Connection = Depends(get_db)):
-            cursor = await db.execute("SELECT * FROM table")
+            rows = await db.execute_fetchall("SELECT * FROM table")
     """
     async with db_manager.connect() as db:
         yield db
 
 
+# =============================================================================
+# Aggregate Response Cache
+# =============================================================================
+
+# key -> (expires_at monotonic time, response model)
+_agg_cache: Dict[Any, Tuple[float, Any]] = {}
+
+# key -> lock held while that response is being recomputed
+_agg_locks: Dict[Any, asyncio.Lock] = {}
+
+
+def agg_cache_get(key: Any) -> Optional[Any]:
+    """
+    Return a cached aggregate response if it has not expired.
+
+    Args:
+        key: Cache key (endpoint name plus any query parameters).
+
+    Returns:
+        The cached response, or None on a miss.
+    """
+    cached = _agg_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def agg_cache_put(key: Any, value: Any, ttl: float = AGG_CACHE_TTL_SECONDS) -> None:
+    """
+    Store an aggregate response for ttl seconds.
+
+    Args:
+        key: Cache key (endpoint name plus any query parameters).
+        value: Response to cache.
+        ttl: Lifetime in seconds (defaults to AGG_CACHE_TTL_SECONDS).
+    """
+    if ttl > 0:
+        _agg_cache[key] = (time.monotonic() + ttl, value)
+
+
+@asynccontextmanager
+async def agg_cache_fill(key: Any) -> AsyncGenerator[Optional[Any], None]:
+    """
+    Let one request at a time recompute an expired aggregate response.
+
+    Yields the cached response if it is fresh, including one stored by
+    another request while this one waited for the key's lock; otherwise
+    yields None, and the caller computes the response and stores it with
+    agg_cache_put() before leaving the block. Concurrent misses therefore
+    run the aggregate query once instead of once each.
+
+    Args:
+        key: Cache key (endpoint name plus any query parameters).
+
+    Yields:
+        The cached response, or None if the caller must compute it.
+    """
+    cached = agg_cache_get(key)
+    if cached is not None or AGG_CACHE_TTL_SECONDS <= 0:
+        yield cached
+        return
+
+    lock = _agg_locks.get(key)
+    if lock is None:
+        lock = _agg_locks[key] = asyncio.Lock()
+    async with lock:
+        yield agg_cache_get(key)
+
+
+# =============================================================================
+# Background Tasks
+# =============================================================================
+
+# How often the cached ISO timestamp is refreshed
+CLOCK_TICK_SECONDS: float = 0.1
+
+# Current UTC time in ISO format, refreshed by _tick_clock() so handlers
+# don't format a fresh datetime on every error/health response
+_now_iso: str = datetime.utcnow().isoformat()
+
+# Timestamp of the newest drop, refreshed by _refresh_last_data_update() so
+# health probes never scan plinko_rounds
+_last_data_update: Optional[str] = None
+
+# Tasks started at startup and cancelled at shutdown
+_background_tasks: List["asyncio.Task[None]"] = []
+
+
+async def _tick_clock() -> None:
+    """Refresh _now_iso every CLOCK_TICK_SECONDS until cancelled."""
+    global _now_iso
+    while True:
+        _now_iso = datetime.utcnow().isoformat()
+        await asyncio.sleep(CLOCK_TICK_SECONDS)
+
+
+async def _refresh_last_data_update() -> None:
+    """Refresh _last_data_update every LAST_UPDATE_REFRESH_SECONDS until cancelled."""
+    global _last_data_update
+    while True:
+        try:
+            async with db_manager.connect() as db:
+                _last_data_update = (await db.execute_fetchall(LAST_UPDATE_SQL))[0][0]
+        except Exception as e:
+            logger.warning("Failed to refresh last data update: %s", e)
+        await asyncio.sleep(LAST_UPDATE_REFRESH_SECONDS)
+
+
 # =============================================================================
 # FastAPI Application Setup
 # =============================================================================
@@ -283,7 +619,10 @@ app = FastAPI(
     description="Real-time statistics API for BGaming Plinko game",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    # Handlers below return plain dicts; the model documents their shape
+    responses={500: {"model": ErrorResponse}}
 )
 
 
@@ -298,16 +637,21 @@ app.add_middleware(
     allow_methods=["GET", "HEAD", "OPTIONS"],  # Read-only API
     allow_headers=["Content-Type", "Accept"],
     expose_headers=["Content-Length", "Content-Range"],
-    max_age=3600,
+    max_age=86400,  # Let browsers cache preflight results for a day
 )
 
+# Compress large payloads (e.g. /api/drops pages); disable with GZIP_ENABLED=false
+# when a reverse proxy already compresses responses
+if GZIP_ENABLED:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # =============================================================================
 # Exception Handlers
 # =============================================================================
 
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """
     Global exception handler for unhandled exceptions.
 
@@ -316,23 +660,22 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
         exc: The exception that was raised.
 
     Returns:
-        JSONResponse: Standardized error response with 500 status code.
-    """
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    error_response = ErrorResponse(
-        error="internal_error",
-        detail="An internal server error occurred",
-        timestamp=datetime.utcnow().isoformat(),
-        request_id=request.headers.get("X-Request-ID")
-    )
-    return JSONResponse(
+        ORJSONResponse: Standardized error response with 500 status code.
+    """
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=500,
-        content=error_response.model_dump()
+        content={
+            "error": "internal_error",
+            "detail": "An internal server error occurred",
+            "timestamp": _now_iso,
+            "request_id": request.headers.get("X-Request-ID"),
+        }
     )
 
 
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """
     Handler for HTTP exceptions.
 
@@ -341,23 +684,22 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         exc: The HTTPException that was raised.
 
     Returns:
-        JSONResponse: Standardized error response.
-    """
-    logger.warning(f"HTTP exception: {exc.status_code} - {exc.detail}")
-    error_response = ErrorResponse(
-        error="http_error",
-        detail=str(exc.detail),
-        timestamp=datetime.utcnow().isoformat(),
-        request_id=request.headers.get("X-Request-ID")
-    )
-    return JSONResponse(
+        ORJSONResponse: Standardized error response.
+    """
+    logger.warning("HTTP exception: %s - %s", exc.status_code, exc.detail)
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=error_response.model_dump()
+        content={
+            "error": "http_error",
+            "detail": str(exc.detail),
+            "timestamp": _now_iso,
+            "request_id": request.headers.get("X-Request-ID"),
+        }
     )
 
 
 @app.exception_handler(ValueError)
-async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
+async def value_error_handler(request: Request, exc: ValueError) -> ORJSONResponse:
     """
     Handler for validation errors.
 
@@ -366,18 +708,17 @@ async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse
         exc: The ValueError that was raised.
 
     Returns:
-        JSONResponse: Standardized error response with 422 status code.
-    """
-    logger.warning(f"Validation error: {exc}")
-    error_response = ErrorResponse(
-        error="validation_error",
-        detail=str(exc),
-        timestamp=datetime.utcnow().isoformat(),
-        request_id=request.headers.get("X-Request-ID")
-    )
-    return JSONResponse(
+        ORJSONResponse: Standardized error response with 422 status code.
+    """
+    logger.warning("Validation error: %s", exc)
+    return ORJSONResponse(
         status_code=422,
-        content=error_response.model_dump()
+        content={
+            "error": "validation_error",
+            "detail": str(exc),
+            "timestamp": _now_iso,
+            "request_id": request.headers.get("X-Request-ID"),
+        }
     )
 
 
@@ -390,55 +731,77 @@ async def startup() -> None:
     """
     Application startup event handler.
 
-    Creates the database table and indexes if they don't exist.
-    Logs the startup process for monitoring.
+    Creates the schema on a new database, opens the shared database
+    connection and checks that the schema is current, then starts the
+    background tasks. Logs the startup process for monitoring.
+
+    Raises:
+        RuntimeError: If the database holds an older schema that the
+            collector has not migrated yet.
     """
     logger.info("Starting Plinko Tracker API...")
 
+    # The collector (or `python plinko_schema.py`) owns migrations, so the
+    # API never races it through one; it only creates a missing schema
     try:
-        async with db_manager.connect() as db:
-            # Create main table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS plinko_rounds (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    drop_id TEXT UNIQUE NOT NULL,
-                    risk_level TEXT NOT NULL,
-                    rows INTEGER NOT NULL,
-                    landing_position INTEGER NOT NULL,
-                    multiplier REAL NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Create indexes for performance
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_multiplier ON plinko_rounds(multiplier)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_created ON plinko_rounds(created_at DESC)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_drop_id ON plinko_rounds(drop_id)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_risk_level ON plinko_rounds(risk_level)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_rows ON plinko_rounds(rows)"
-            )
-
-            await db.commit()
-            logger.info("Database initialized successfully")
+        if await asyncio.to_thread(create_if_missing_path, db_manager.db_path):
+            logger.info("Created the database schema")
+        async with db_manager.connect():
+            version = (await db_manager.read("PRAGMA user_version"))[0][0]
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}", exc_info=True)
+        logger.error("Failed to open database: %s", e, exc_info=True)
         raise
 
+    if version < SCHEMA_VERSION:
+        await db_manager.close()
+        raise RuntimeError(
+            f"Database schema version {version} is older than {SCHEMA_VERSION}; "
+            "start the collector or run `python plinko_schema.py` to migrate it"
+        )
+    logger.info("Database schema version %s", version)
+
+    _background_tasks.append(asyncio.create_task(_tick_clock()))
+    _background_tasks.append(asyncio.create_task(_refresh_last_data_update()))
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    """
+    Application shutdown event handler.
+
+    Stops the background tasks and closes the shared database connection.
+    """
+    for task in _background_tasks:
+        task.cancel()
+    _background_tasks.clear()
+    await db_manager.close()
+
 
 # =============================================================================
 # API Endpoints
 # =============================================================================
 
-@app.get("/api/drops", response_model=DropsResponse)
+async def options_handler() -> Response:
+    """
+    Answer plain OPTIONS requests without reaching the error handlers.
+
+    CORS preflights are handled by CORSMiddleware and never get here; this
+    covers the remaining OPTIONS requests, which would otherwise end in a
+    405 HTTPException. Registered for every API path at the bottom of the
+    module.
+
+    Returns:
+        Response: Empty 204 response listing the allowed methods.
+    """
+    # A fresh Response per request: middleware mutates the header list
+    return Response(status_code=204, headers=OPTIONS_HEADERS)
+
+
+@app.get(
+    "/api/drops",
+    response_model=None,
+    responses={200: {"model": DropsResponse}},
+)
 async def get_drops(
     limit: int = Query(
         default=50,
@@ -451,73 +814,84 @@ async def get_drops(
         ge=0,
         description="Number of drops to skip (must be >= 0)"
     ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Keyset cursor from a previous page's next_cursor"
+    ),
     db: aiosqlite.Connection = Depends(get_db)
-) -> DropsResponse:
+) -> ORJSONResponse:
     """
     Get paginated list of Plinko drops.
 
     Retrieves Plinko drops ordered by creation time (most recent first).
-    Supports pagination through limit and offset parameters.
+    Supports keyset pagination through cursor (constant cost at any depth)
+    and, for backwards compatibility, limit and offset.
 
     Args:
         limit: Maximum number of drops to return (default: 50, max: 500).
         offset: Number of drops to skip for pagination (default: 0).
+            Ignored when cursor is given.
+        cursor: Opaque "<created_at ms>|<id>" cursor returned as next_cursor.
         db: Database connection (injected).
 
     Returns:
-        DropsResponse: Paginated list of drops with total count.
+        ORJSONResponse: Paginated list of drops with total count, shaped
+        like DropsResponse but serialized without model construction.
 
     Raises:
-        HTTPException: If database query fails.
+        HTTPException: 400 if the cursor is malformed, 500 if database query fails.
 
     Example:
-        GET /api/drops?limit=100&offset=0
-        Response: {"items": [...], "total": 5000}
+        GET /api/drops?limit=100
+        Response: {"items": [...], "total": 5000, "next_cursor": "1705314600000|4901"}
     """
-    logger.debug(f"Fetching drops with limit={limit}, offset={offset}")
+    logger.debug("Fetching drops with limit=%s, offset=%s, cursor=%s", limit, offset, cursor)
+
+    if cursor is not None:
+        match = DROPS_CURSOR_RE.fullmatch(cursor)
+        if match is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        before_created_at, before_id = int(match[1]), int(match[2])
+        if before_created_at > SQLITE_MAX_INTEGER or before_id > SQLITE_MAX_INTEGER:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
     try:
-        # Get total count
-        cursor = await db.execute("SELECT COUNT(*) FROM plinko_rounds")
-        total = (await cursor.fetchone())[0]
-
-        # Get paginated drops
-        cursor = await db.execute(
-            """
-            SELECT drop_id, risk_level, rows, landing_position, multiplier, created_at
-            FROM plinko_rounds
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            (limit, offset)
-        )
-        rows = await cursor.fetchall()
-
-        items = [
-            Drop(
-                drop_id=row["drop_id"],
-                risk_level=row["risk_level"],
-                rows=row["rows"],
-                landing_position=row["landing_position"],
-                multiplier=row["multiplier"],
-                created_at=row["created_at"]
-            )
-            for row in rows
-        ]
+        if offset and cursor is None:
+            # OFFSET walks past skipped rows: keep it off the event loop
+            total = (await db.execute_fetchall(DROPS_TOTAL_SQL))[0][0]
+            rows = await db.execute_fetchall(DROPS_PAGE_SQL, (limit, offset))
+        else:
+            # Counter lookup plus an index seek of at most `limit` rows:
+            # cheaper inline than a round-trip to the aiosqlite thread
+            total = (await db_manager.read(DROPS_TOTAL_SQL))[0][0]
+            if cursor is not None:
+                rows = await db_manager.read(
+                    DROPS_AFTER_CURSOR_SQL, (before_created_at, before_id, limit)
+                )
+            else:
+                rows = await db_manager.read(DROPS_PAGE_SQL, (limit, 0))
+
+        # created_at is already ISO formatted by the query
+        items = [dict(zip(DROP_FIELDS, row)) for row in rows]
+        next_cursor = f"{rows[-1][6]}|{rows[-1][7]}" if len(rows) == limit else None
 
-        logger.info(f"Retrieved {len(items)} drops (total: {total})")
-        return DropsResponse(items=items, total=total)
+        logger.info("Retrieved %s drops (total: %s)", len(items), total)
+        return ORJSONResponse({"items": items, "total": total, "next_cursor": next_cursor})
 
     except aiosqlite.Error as e:
-        logger.error(f"Database error fetching drops: {e}", exc_info=True)
+        logger.error("Database error fetching drops: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Failed to fetch drops from database"
         ) from e
 
 
-@app.get("/api/stats/summary", response_model=SummaryStats)
-async def get_summary(db: aiosqlite.Connection = Depends(get_db)) -> SummaryStats:
+@app.get(
+    "/api/stats/summary",
+    response_model=None,
+    responses={200: {"model": SummaryStats}},
+)
+async def get_summary(db: aiosqlite.Connection = Depends(get_db)) -> ORJSONResponse:
     """
     Get summary statistics for all Plinko drops.
 
@@ -528,7 +902,7 @@ async def get_summary(db: aiosqlite.Connection = Depends(get_db)) -> SummaryStat
         db: Database connection (injected).
 
     Returns:
-        SummaryStats: Aggregate statistics for all drops.
+        ORJSONResponse: Aggregate statistics for all drops (SummaryStats shape).
 
     Raises:
         HTTPException: If database query fails.
@@ -537,53 +911,44 @@ async def get_summary(db: aiosqlite.Connection = Depends(get_db)) -> SummaryStat
         GET /api/stats/summary
         Response: {"total_drops": 5000, "avg_multiplier": 2.45, ...}
     """
-    logger.debug("Fetching summary statistics")
+    async with agg_cache_fill("summary") as cached:
+        if cached is not None:
+            return ORJSONResponse(cached)
 
-    try:
-        # Get main statistics in a single query
-        cursor = await db.execute("""
-            SELECT
-                COUNT(*) as total,
-                AVG(multiplier) as avg,
-                MAX(multiplier) as max,
-                MIN(multiplier) as min,
-                SUM(CASE WHEN multiplier < 2 THEN 1 ELSE 0 END) as under_2x,
-                SUM(CASE WHEN multiplier >= 10 THEN 1 ELSE 0 END) as over_10x
-            FROM plinko_rounds
-        """)
-        row = await cursor.fetchone()
-
-        # Calculate median
-        cursor = await db.execute("""
-            SELECT multiplier FROM plinko_rounds
-            ORDER BY multiplier
-            LIMIT 1 OFFSET (SELECT COUNT(*) FROM plinko_rounds) / 2
-        """)
-        median_row = await cursor.fetchone()
-        median = median_row[0] if median_row else 0.0
-
-        result = SummaryStats(
-            total_drops=row[0] or 0,
-            avg_multiplier=round(row[1] or 0, 4),
-            max_multiplier=row[2] or 0,
-            min_multiplier=row[3] or 0,
-            median_multiplier=round(median, 4),
-            under_2x_count=row[4] or 0,
-            over_10x_count=row[5] or 0
-        )
+        logger.debug("Fetching summary statistics")
 
-        logger.info(f"Summary stats: {result.total_drops} total drops")
-        return result
+        try:
+            # Aggregates and median in a single round-trip
+            row = (await db.execute_fetchall(SUMMARY_SQL))[0]
+            median = row[6] or 0.0
+
+            result = {
+                "total_drops": row[0] or 0,
+                "avg_multiplier": round(float(row[1] or 0), 4),
+                "median_multiplier": round(float(median), 4),
+                "max_multiplier": float(row[2] or 0),
+                "min_multiplier": float(row[3] or 0),
+                "under_2x_count": row[4] or 0,
+                "over_10x_count": row[5] or 0,
+            }
+
+            agg_cache_put("summary", result)
+            logger.info("Summary stats: %s total drops", result['total_drops'])
+            return ORJSONResponse(result)
 
-    except aiosqlite.Error as e:
-        logger.error(f"Database error fetching summary: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to fetch summary statistics"
-        ) from e
+        except aiosqlite.Error as e:
+            logger.error("Database error fetching summary: %s", e, exc_info=True)
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to fetch summary statistics"
+            ) from e
 
 
-@app.get("/api/stats/recent", response_model=RecentStats)
+@app.get(
+    "/api/stats/recent",
+    response_model=None,
+    responses={200: {"model": RecentStats}},
+)
 async def get_recent_stats(
     limit: int = Query(
         default=100,
@@ -592,7 +957,7 @@ async def get_recent_stats(
         description="Number of recent drops to analyze (1-1000)"
     ),
     db: aiosqlite.Connection = Depends(get_db)
-) -> RecentStats:
+) -> ORJSONResponse:
     """
     Get statistics for recent Plinko drops.
 
@@ -603,7 +968,7 @@ async def get_recent_stats(
         db: Database connection (injected).
 
     Returns:
-        RecentStats: Statistics for recent drops.
+        ORJSONResponse: Statistics for recent drops (RecentStats shape).
 
     Raises:
         HTTPException: If database query fails.
@@ -612,42 +977,40 @@ async def get_recent_stats(
         GET /api/stats/recent?limit=500
         Response: {"avg_multiplier": 2.35, "under_2x_pct": 52.4}
     """
-    logger.debug(f"Fetching recent stats for last {limit} drops")
+    async with agg_cache_fill(("recent", limit)) as cached:
+        if cached is not None:
+            return ORJSONResponse(cached)
 
-    try:
-        cursor = await db.execute("""
-            SELECT
-                AVG(multiplier) as avg_multiplier,
-                SUM(CASE WHEN multiplier < 2 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as under_2x_pct
-            FROM (
-                SELECT multiplier
-                FROM plinko_rounds
-                ORDER BY created_at DESC
-                LIMIT ?
-            )
-        """, (limit,))
-        row = await cursor.fetchone()
+        logger.debug("Fetching recent stats for last %s drops", limit)
 
-        result = RecentStats(
-            avg_multiplier=round(row[0] or 0, 4),
-            under_2x_pct=round(row[1] or 0, 2)
-        )
+        try:
+            row = (await db.execute_fetchall(RECENT_SQL, (limit,)))[0]
 
-        logger.info(f"Recent stats (last {limit}): avg={result.avg_multiplier}")
-        return result
+            result = {
+                "avg_multiplier": round(float(row[0] or 0), 4),
+                "under_2x_pct": round(float(row[1] or 0), 2),
+            }
 
-    except aiosqlite.Error as e:
-        logger.error(f"Database error fetching recent stats: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to fetch recent statistics"
-        ) from e
+            agg_cache_put(("recent", limit), result)
+            logger.info("Recent stats (last %s): avg=%s", limit, result['avg_multiplier'])
+            return ORJSONResponse(result)
 
+        except aiosqlite.Error as e:
+            logger.error("Database error fetching recent stats: %s", e, exc_info=True)
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to fetch recent statistics"
+            ) from e
 
-@app.get("/api/distribution", response_model=List[DistributionBucket])
+
+@app.get(
+    "/api/distribution",
+    response_model=None,
+    responses={200: {"model": List[DistributionBucket]}},
+)
 async def get_distribution(
     db: aiosqlite.Connection = Depends(get_db)
-) -> List[DistributionBucket]:
+) -> ORJSONResponse:
     """
     Get multiplier distribution across predefined ranges.
 
@@ -658,7 +1021,8 @@ async def get_distribution(
         db: Database connection (injected).
 
     Returns:
-        List[DistributionBucket]: Distribution data for each range bucket.
+        ORJSONResponse: Distribution data for each range bucket
+        (List[DistributionBucket] shape).
 
     Raises:
         HTTPException: If database query fails.
@@ -671,50 +1035,53 @@ async def get_distribution(
             ...
         ]
     """
-    logger.debug("Fetching multiplier distribution")
+    async with agg_cache_fill("distribution") as cached:
+        if cached is not None:
+            return ORJSONResponse(cached)
 
-    try:
-        # Get total count first
-        cursor = await db.execute("SELECT COUNT(*) FROM plinko_rounds")
-        total = (await cursor.fetchone())[0] or 1  # Avoid division by zero
+        logger.debug("Fetching multiplier distribution")
 
-        result: List[DistributionBucket] = []
+        try:
+            rows = await db.execute_fetchall(DISTRIBUTION_SQL)
+            counts: Dict[Optional[str], int] = {bucket: count for bucket, count in rows}
+            total = sum(counts.values()) or 1  # Avoid division by zero
 
-        # Query each bucket (could be optimized with CASE statements in single query)
-        for name, condition in DISTRIBUTION_BUCKETS:
-            cursor = await db.execute(
-                f"SELECT COUNT(*) FROM plinko_rounds WHERE multiplier {condition}"
-            )
-            count = (await cursor.fetchone())[0]
-            percentage = round((count / total) * 100, 2)
+            result: List[Dict[str, Any]] = []
 
-            result.append(DistributionBucket(
-                range=name,
-                count=count,
-                percentage=percentage
-            ))
+            for name, _ in DISTRIBUTION_BUCKETS:
+                count = counts.get(name, 0)
+                percentage = round((count / total) * 100, 2)
 
-        logger.info(f"Distribution calculated for {total} drops")
-        return result
+                result.append({"range": name, "count": count, "percentage": percentage})
 
-    except aiosqlite.Error as e:
-        logger.error(f"Database error fetching distribution: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to fetch distribution data"
-        ) from e
+            agg_cache_put("distribution", result)
+            logger.info("Distribution calculated for %s drops", total)
+            return ORJSONResponse(result)
 
+        except aiosqlite.Error as e:
+            logger.error("Database error fetching distribution: %s", e, exc_info=True)
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to fetch distribution data"
+            ) from e
 
-@app.get("/api/health", response_model=HealthResponse)
-async def health() -> HealthResponse:
+
+@app.get(
+    "/api/health",
+    response_model=None,
+    responses={200: {"model": HealthResponse}},
+)
+async def health() -> ORJSONResponse:
     """
     Health check endpoint for monitoring and orchestration.
 
-    Checks database connectivity and returns the service health status
-    along with the timestamp of the most recent data update.
+    Checks database connectivity with a trivial query and returns the
+    service health status along with the timestamp of the most recent data
+    update (refreshed in the background). Healthy responses are cached for
+    HEALTH_CACHE_TTL_SECONDS so frequent probes cost almost nothing.
 
     Returns:
-        HealthResponse: Service health status and metadata.
+        ORJSONResponse: Service health status and metadata (HealthResponse shape).
 
     Example:
         GET /api/health
@@ -726,37 +1093,38 @@ async def health() -> HealthResponse:
             "timestamp": "2026-01-17T10:35:00"
         }
     """
+    cached = agg_cache_get("health")
+    if cached is not None:
+        return ORJSONResponse(cached)
+
     logger.debug("Health check requested")
 
     try:
-        async with db_manager.connect() as db:
-            # Check database connectivity and get last update time
-            cursor = await db.execute(
-                "SELECT MAX(created_at) FROM plinko_rounds"
-            )
-            last_update_row = await cursor.fetchone()
-            last_update = last_update_row[0] if last_update_row and last_update_row[0] else None
-
-            response = HealthResponse(
-                status="healthy",
-                game="plinko",
-                database="connected",
-                last_data_update=str(last_update) if last_update else "No data",
-                timestamp=datetime.utcnow().isoformat()
-            )
-
+        async with db_manager.connect():
+            # Check database connectivity
+            await db_manager.read("SELECT 1")
+
+            response = {
+                "status": "healthy",
+                "game": "plinko",
+                "database": "connected",
+                "last_data_update": _last_data_update or "No data",
+                "timestamp": _now_iso,
+            }
+
+            agg_cache_put("health", response, ttl=HEALTH_CACHE_TTL_SECONDS)
             logger.info("Health check: healthy")
-            return response
+            return ORJSONResponse(response)
 
     except Exception as e:
-        logger.error(f"Health check failed: {e}", exc_info=True)
-        return HealthResponse(
-            status="unhealthy",
-            game="plinko",
-            database="disconnected",
-            last_data_update=None,
-            timestamp=datetime.utcnow().isoformat()
-        )
+        logger.error("Health check failed: %s", e, exc_info=True)
+        return ORJSONResponse({
+            "status": "unhealthy",
+            "game": "plinko",
+            "database": "disconnected",
+            "last_data_update": None,
+            "timestamp": _now_iso,
+        })
 
 
 # =============================================================================
@@ -768,9 +1136,34 @@ async def health() -> HealthResponse:
 plinko_stats_router = create_plinko_router(db_manager)
 app.include_router(plinko_stats_router)
 
+# OPTIONS for each existing API path, added once every router is included.
+# A catch-all route would turn 404s for unknown paths into 405s
+for api_path in sorted({
+    route.path for route in app.routes
+    if isinstance(route, APIRoute) and route.path.startswith("/api/")
+}):
+    app.add_api_route(
+        api_path, options_handler, methods=["OPTIONS"], include_in_schema=False
+    )
+
 
 if __name__ == "__main__":
     import uvicorn
 
     logger.info("Starting Plinko Tracker API server...")
-    uvicorn.run(app, host="0.0.0.0", port=8004)
+    workers = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+    # Worker processes need an import string, resolved from this directory
+    # whatever the working directory is; each worker runs startup and opens
+    # its own shared database connection. A single process serves this
+    # already-imported app instead of importing the module a second time.
+    # "auto" picks uvloop and httptools when they are installed
+    uvicorn.run(
+        app if workers == 1 else "main:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host="0.0.0.0",
+        port=8004,
+        loop="auto",
+        http="auto",
+        workers=workers,
+        access_log=os.getenv("ACCESS_LOG", "false").lower() == "true",
+    )
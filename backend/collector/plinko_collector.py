@@ -17,15 +17,31 @@ Version: 1.0.0
 """
 
 import asyncio
-import json
 import logging
+import logging.handlers
 import os
+import queue
+import random
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
 
 import aiosqlite
-from playwright.async_api import async_playwright, Page, WebSocket
+import numpy as np
+import orjson
+from playwright.async_api import async_playwright, Browser, Page, WebSocket
+
+# The schema module is shared with the API and lives in backend/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from plinko_schema import RISK_LEVEL_IDS, RISK_LEVEL_NAMES, migrate_path
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (no Windows build); asyncio's loop is used instead
+    uvloop = None
 
 
 # =============================================================================
@@ -57,6 +73,45 @@ def setup_logger(name: str) -> logging.Logger:
     return logger
 
 
+def start_log_listener(logger: logging.Logger) -> logging.handlers.QueueListener:
+    """
+    Move a logger's handlers behind a QueueListener thread.
+
+    The logger is left with a single QueueHandler, so formatting and writing
+    records happens on the listener thread and a slow or blocked stdout
+    never stalls the event loop. Undo with stop_log_listener().
+
+    Args:
+        logger: Logger whose handlers should be moved.
+
+    Returns:
+        logging.handlers.QueueListener: The started listener.
+    """
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *logger.handlers, respect_handler_level=True
+    )
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
+def stop_log_listener(
+    logger: logging.Logger,
+    listener: logging.handlers.QueueListener
+) -> None:
+    """
+    Flush and stop a listener from start_log_listener() and restore the
+    logger's original handlers.
+
+    Args:
+        logger: Logger passed to start_log_listener().
+        listener: Listener it returned.
+    """
+    listener.stop()
+    logger.handlers = list(listener.handlers)
+
+
 logger = setup_logger(__name__)
 
 
@@ -66,39 +121,134 @@ logger = setup_logger(__name__)
 
 DATABASE_PATH: str = os.getenv("DATABASE_PATH", "plinko.db")
 
+# PRAGMAs applied when the writer connection opens. WAL is persistent, so
+# readers (the API) no longer block the writer and each commit appends
+# instead of rewriting pages; with WAL, synchronous=NORMAL only fsyncs at
+# checkpoints. busy_timeout rides out a concurrent schema migration instead of
+# failing a write with "database is locked"
+SQLITE_PRAGMAS: List[str] = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+]
+
+# The one INSERT every write path submits. Reusing the exact same text lets
+# the connection's prepared-statement cache skip re-parsing and re-planning
+INSERT_SQL: str = (
+    "INSERT OR IGNORE INTO plinko_rounds "
+    "(drop_id, risk_level, rows, landing_position, multiplier) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+# Number of drops written per transaction by the batched insert path
+DROP_BATCH_SIZE: int = int(os.getenv("DROP_BATCH_SIZE", "50"))
+
+# How long the live batch writer waits for more drops before committing a
+# partial batch, bounding the latency a drop spends in the queue
+DROP_BATCH_WAIT_SECONDS: float = float(os.getenv("DROP_BATCH_WAIT_SECONDS", "0.02"))
+
+# Drops the live queue holds before the oldest are evicted. Kept small so a
+# stalled database shows up as evictions soon rather than being hidden
+# behind a large buffer
+DROP_QUEUE_MAXSIZE: int = int(os.getenv("DROP_QUEUE_MAXSIZE", "1024"))
+
+# Minimum seconds between warnings about evicted drops
+DROP_WARNING_INTERVAL_SECONDS: float = 1.0
+
+# Page sessions served by one Chromium process before it is relaunched.
+# Each session gets a fresh context; relaunching periodically also hands
+# back native memory that closing contexts does not
+BROWSER_MAX_SESSIONS: int = int(os.getenv("BROWSER_MAX_SESSIONS", "10"))
+
+# Largest power of two applied to retry_delay by the reconnect backoff
+RETRY_BACKOFF_MAX_EXPONENT: int = 6
+
+# Upper bound on any single reconnect wait, whatever retry_delay is
+RETRY_MAX_DELAY_SECONDS: float = 60.0
+
+# Candidate field names are kept in priority order: the first field present
+# in a message wins.
 # Known field names for multiplier extraction from various message formats
-MULTIPLIER_FIELDS: List[str] = [
+MULTIPLIER_FIELDS: Tuple[str, ...] = (
     'multiplier', 'payout', 'result', 'coefficient',
     'odds', 'prize', 'win'
-]
+)
 
 # Known field names for drop ID extraction
-DROP_ID_FIELDS: List[str] = [
+DROP_ID_FIELDS: Tuple[str, ...] = (
     'dropId', 'gameId', 'id', 'drop', 'dropNumber',
     'gameNumber', 'sessionId', 'ballId'
-]
+)
 
 # Known field names for risk level extraction
-RISK_LEVEL_FIELDS: List[str] = [
+RISK_LEVEL_FIELDS: Tuple[str, ...] = (
     'risk', 'riskLevel', 'risk_level', 'difficulty', 'mode'
-]
+)
 
 # Known field names for rows extraction
-ROWS_FIELDS: List[str] = [
+ROWS_FIELDS: Tuple[str, ...] = (
     'rows', 'rowCount', 'row_count', 'pins', 'levels'
-]
+)
 
 # Known field names for landing position extraction
-POSITION_FIELDS: List[str] = [
+POSITION_FIELDS: Tuple[str, ...] = (
     'position', 'landing', 'slot', 'bucket', 'landingPosition',
     'landing_position', 'finalPosition', 'final_position'
+)
+
+# Known field names for message type extraction
+MESSAGE_TYPE_FIELDS: Tuple[str, ...] = (
+    'type', 't', 'action', 'event', 'messageType', 'cmd'
+)
+
+# Every candidate name of the drop fields resolved by _extract_all, mapped
+# to (result key, priority within its field, converter, accepted raw types),
+# so a message's keys can be classified with one dict lookup each. Numeric
+# fields only accept scalars; nested dicts are never converted
+NUMERIC_FIELD_TYPES: Tuple[type, ...] = (int, float, str)
+
+FIELD_LOOKUP: Dict[str, Tuple[str, int, Callable[[Any], Any], Any]] = {
+    field: (name, rank, convert, types)
+    for name, candidates, convert, types in (
+        ('multiplier', MULTIPLIER_FIELDS, float, NUMERIC_FIELD_TYPES),
+        ('landing_position', POSITION_FIELDS, int, NUMERIC_FIELD_TYPES),
+        ('drop_id', DROP_ID_FIELDS, str, object),
+        ('risk_level', RISK_LEVEL_FIELDS, lambda value: str(value).lower(), object),
+        ('rows', ROWS_FIELDS, int, NUMERIC_FIELD_TYPES),
+    )
+    for rank, field in enumerate(candidates)
+}
+EXTRACTED_FIELD_COUNT: int = len({entry[0] for entry in FIELD_LOOKUP.values()})
+
+# Shape of a frame that _extract_all resolved without any conversion failure:
+# the key set of every nesting level it visited, whether it stopped early
+# because every field was found, (level, key) of every candidate skipped for
+# holding a non-scalar, and (level, key, field, converter, accepted types) of
+# every field it took. A frame with the same key sets whose skipped
+# candidates are still non-scalar resolves to the same keys
+FramePath = Tuple[
+    Tuple[FrozenSet[str], ...],
+    bool,
+    Tuple[Tuple[int, str, Any], ...],
+    Tuple[Tuple[int, str, str, Callable[[Any], Any], Any], ...],
 ]
 
 # Message types that indicate a drop has completed
-END_MESSAGE_TYPES: List[str] = [
+END_MESSAGE_TYPES: FrozenSet[str] = frozenset({
     'drop_result', 'result', 'finish', 'end', 'ball_landed',
     'drop_end', 'completed', 'landed'
-]
+})
+
+# Every drop carries a multiplier, so frames that never mention one of its
+# field names as a JSON key can be skipped without parsing. Binary frames are
+# matched with the bytes twin so they never need decoding first
+MULTIPLIER_KEY_RE = re.compile(
+    r'"(?:' + '|'.join(map(re.escape, MULTIPLIER_FIELDS)) + r')"\s*:'
+)
+MULTIPLIER_KEY_BYTES_RE = re.compile(MULTIPLIER_KEY_RE.pattern.encode())
 
 
 # =============================================================================
@@ -167,14 +317,60 @@ class PlinkoCollector:
         self.drops_collected: int = 0
         self.max_retries: int = max_retries
         self.retry_delay: float = retry_delay
+        self._db: Optional[aiosqlite.Connection] = None
+        self._db_lock = asyncio.Lock()
+
+        # Validated drops from the WebSocket handler, written by the writer
+        # thread; None is the stop sentinel
+        self._queue: "queue.Queue[Optional[Tuple[str, int, int, int, float]]]" = queue.Queue(
+            maxsize=DROP_QUEUE_MAXSIZE
+        )
+        self._writer: Optional[threading.Thread] = None
+        # Set once the stop sentinel is due, so no drop can evict it
+        self._closing: bool = False
+        self.drops_discarded: int = 0
+        self._discarded_since_warning: int = 0
+        self._last_discard_warning: float = 0.0
+
+        # Frame shape learned from the last cleanly parsed message
+        self._fast_path: Optional[FramePath] = None
 
-        logger.info(f"PlinkoCollector initialized with db_path={self.db_path}")
+        logger.info("PlinkoCollector initialized with db_path=%s", self.db_path)
+
+    async def _connection(self) -> aiosqlite.Connection:
+        """
+        Open the long-lived database connection if needed and return it.
+
+        Every write reuses this one connection, so SQLite's page cache stays
+        warm and no drop pays for opening the file or starting a new
+        aiosqlite worker thread.
+
+        Returns:
+            aiosqlite.Connection: Shared connection with SQLITE_PRAGMAS set.
+        """
+        if self._db is None:
+            async with self._db_lock:
+                if self._db is None:
+                    db = await aiosqlite.connect(self.db_path)
+                    for pragma in SQLITE_PRAGMAS:
+                        await db.execute(pragma)
+                    self._db = db
+        return self._db
+
+    async def close(self) -> None:
+        """
+        Close the shared database connection, if it is open.
+        """
+        if self._db is not None:
+            db, self._db = self._db, None
+            await db.close()
 
     async def init_db(self) -> None:
         """
         Initialize the database schema.
 
-        Creates the plinko_rounds table if it doesn't exist.
+        Creates or migrates the schema through plinko_schema, which also
+        switches the database to WAL mode, then opens the write connection.
 
         Raises:
             DatabaseError: If database initialization fails.
@@ -182,46 +378,26 @@ class PlinkoCollector:
         logger.info("Initializing database...")
 
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    CREATE TABLE IF NOT EXISTS plinko_rounds (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        drop_id TEXT UNIQUE NOT NULL,
-                        risk_level TEXT NOT NULL,
-                        rows INTEGER NOT NULL,
-                        landing_position INTEGER NOT NULL,
-                        multiplier REAL NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                await db.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_created ON plinko_rounds(created_at DESC)"
-                )
-                await db.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_multiplier ON plinko_rounds(multiplier)"
-                )
-                await db.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_risk_level ON plinko_rounds(risk_level)"
-                )
-                await db.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_rows ON plinko_rounds(rows)"
-                )
-                await db.commit()
-                logger.info("Database initialized successfully")
+            # The collector is the only process that migrates; the schema
+            # module serializes concurrent runs itself
+            if await asyncio.to_thread(migrate_path, self.db_path):
+                logger.info("Database schema created or migrated")
+            await self._connection()
+            logger.info("Database initialized successfully")
         except aiosqlite.Error as e:
-            logger.error(f"Database initialization failed: {e}", exc_info=True)
+            logger.error("Database initialization failed: %s", e, exc_info=True)
             raise DatabaseError(f"Failed to initialize database: {e}") from e
 
-    async def save_drop(
+    def _validate_drop(
         self,
         drop_id: str,
         risk_level: str,
         rows: int,
         landing_position: int,
         multiplier: float
-    ) -> bool:
+    ) -> Tuple[str, int, int, int, float]:
         """
-        Save a Plinko drop to the database.
+        Validate and normalize a drop before it is written.
 
         Args:
             drop_id: Unique identifier for the drop.
@@ -231,59 +407,211 @@ class PlinkoCollector:
             multiplier: Multiplier value (must be > 0).
 
         Returns:
-            bool: True if drop was saved successfully, False otherwise.
+            Tuple[str, int, int, int, float]: Row ready for INSERT, with
+            risk_level mapped to its risk_levels id.
 
         Raises:
             ValueError: If parameters are invalid.
         """
         # Validate parameters
         if multiplier <= 0:
-            logger.error(f"Invalid multiplier value: {multiplier} (must be > 0)")
+            logger.error("Invalid multiplier value: %s (must be > 0)", multiplier)
             raise ValueError(f"Multiplier must be positive, got {multiplier}")
 
         if rows <= 0:
-            logger.error(f"Invalid rows value: {rows} (must be > 0)")
+            logger.error("Invalid rows value: %s (must be > 0)", rows)
             raise ValueError(f"Rows must be positive, got {rows}")
 
         if landing_position < 0:
-            logger.error(f"Invalid landing_position value: {landing_position} (must be >= 0)")
+            logger.error("Invalid landing_position value: %s (must be >= 0)", landing_position)
             raise ValueError(f"Landing position must be non-negative, got {landing_position}")
 
         # Normalize risk level
-        risk_level = risk_level.lower()
-        if risk_level not in ['low', 'medium', 'high']:
-            logger.warning(f"Unknown risk level '{risk_level}', defaulting to 'medium'")
-            risk_level = 'medium'
+        risk_id = RISK_LEVEL_IDS.get(risk_level.lower())
+        if risk_id is None:
+            logger.warning("Unknown risk level '%s', defaulting to 'medium'", risk_level.lower())
+            risk_id = RISK_LEVEL_IDS['medium']
+
+        return drop_id, risk_id, rows, landing_position, multiplier
+
+    async def save_drops(self, drops: List[Tuple[str, int, int, int, float]]) -> int:
+        """
+        Save a batch of validated drops in a single transaction.
+
+        One executemany and one commit per batch amortize the per-statement
+        and per-fsync cost that save_drop pays for every drop.
+
+        Args:
+            drops: Rows as returned by _validate_drop.
+
+        Returns:
+            int: Number of drops actually inserted (duplicates are ignored).
+        """
+        if not drops:
+            return 0
 
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    """INSERT OR IGNORE INTO plinko_rounds
-                       (drop_id, risk_level, rows, landing_position, multiplier)
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (drop_id, risk_level, rows, landing_position, multiplier)
-                )
-                await db.commit()
-                self.drops_collected += 1
-                logger.info(
-                    f"Drop saved: drop_id={drop_id}, risk={risk_level}, rows={rows}, "
-                    f"pos={landing_position}, multiplier={multiplier:.2f}x, "
-                    f"total_collected={self.drops_collected}"
-                )
-                return True
-        except aiosqlite.IntegrityError:
-            logger.debug(f"Drop {drop_id} already exists (duplicate)")
-            return False
+            db = await self._connection()
+            cursor = await db.executemany(
+                INSERT_SQL,
+                drops
+            )
+            await db.commit()
+            inserted = cursor.rowcount
         except aiosqlite.Error as e:
-            logger.error(f"Failed to save drop {drop_id}: {e}", exc_info=True)
-            return False
+            logger.error("Failed to save batch of %s drops: %s", len(drops), e, exc_info=True)
+            return 0
+
+        self._count_saved(inserted, len(drops))
+        return inserted
+
+    def _count_saved(self, inserted: int, attempted: int) -> None:
+        """
+        Add a written batch to drops_collected.
+
+        Always runs on the event loop thread (the writer thread schedules it
+        there), so the counter has a single writer.
+
+        Args:
+            inserted: Drops actually inserted.
+            attempted: Drops in the batch, including ignored duplicates.
+        """
+        self.drops_collected += inserted
+        logger.info(
+            "Batch saved: %d/%d drops inserted, total_collected=%d",
+            inserted, attempted, self.drops_collected
+        )
+
+    def _write_batches(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Body of the writer thread: drain the drop queue in micro-batches.
+
+        The thread owns a stdlib sqlite3 connection, so a batch is a direct
+        executemany and commit with no hop through aiosqlite's worker thread,
+        and the event loop's only share of a write is the queue put. Waits
+        for the first drop, then keeps collecting until DROP_BATCH_SIZE drops
+        are queued or DROP_BATCH_WAIT_SECONDS have passed. Returns once it
+        takes the None sentinel, after writing everything queued before it.
+
+        Args:
+            loop: Event loop that _count_saved is scheduled on.
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            for pragma in SQLITE_PRAGMAS:
+                conn.execute(pragma)
+        except sqlite3.Error as e:
+            logger.error("Writer thread failed to open database: %s", e, exc_info=True)
+            return
+
+        stopping = False
+        try:
+            while not stopping:
+                drop = self._queue.get()
+                if drop is None:
+                    break
+
+                batch = [drop]
+                deadline = time.monotonic() + DROP_BATCH_WAIT_SECONDS
+                while len(batch) < DROP_BATCH_SIZE:
+                    try:
+                        drop = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if drop is None:
+                        stopping = True
+                        break
+                    batch.append(drop)
+
+                try:
+                    with conn:
+                        inserted = conn.executemany(INSERT_SQL, batch).rowcount
+                except Exception as e:
+                    # Keep the single writer alive; a dead writer would silently
+                    # strand every drop queued after it
+                    logger.error("Failed to write batch of %s drops: %s", len(batch), e, exc_info=True)
+                    continue
+
+                loop.call_soon_threadsafe(self._count_saved, inserted, len(batch))
+        finally:
+            conn.close()
+
+    def _start_writer(self) -> None:
+        """
+        Start the writer thread for the running event loop.
+        """
+        self._closing = False
+        self._writer = threading.Thread(
+            target=self._write_batches,
+            args=(asyncio.get_running_loop(),),
+            name="plinko-db-writer",
+            daemon=True,
+        )
+        self._writer.start()
+
+    async def _stop_writer(self) -> None:
+        """
+        Let the writer thread commit everything queued, then wait for it.
+
+        The sentinel is queued behind every pending drop, so the thread
+        writes them all before exiting. Drops arriving from then on are
+        refused, since evicting for them could drop the sentinel and leave
+        the writer running. Joining happens off the event loop.
+        """
+        thread, self._writer = self._writer, None
+        if thread is None:
+            return
+        self._closing = True
+
+        if thread.is_alive():
+            # The queue may be full, so wait for room off the event loop
+            await asyncio.to_thread(self._queue.put, None)
+            await asyncio.to_thread(thread.join)
+
+        if not self._queue.empty():
+            logger.warning("%s queued drops were not saved", self._queue.qsize())
+
+    async def save_drop(
+        self,
+        drop_id: str,
+        risk_level: str,
+        rows: int,
+        landing_position: int,
+        multiplier: float
+    ) -> bool:
+        """
+        Save a Plinko drop to the database.
+
+        Args:
+            drop_id: Unique identifier for the drop.
+            risk_level: Risk level (low, medium, high).
+            rows: Number of rows in the Plinko board (must be > 0).
+            landing_position: Landing position (must be >= 0).
+            multiplier: Multiplier value (must be > 0).
+
+        Returns:
+            bool: True if the drop was inserted, False if it was a duplicate
+            or could not be written.
+
+        Raises:
+            ValueError: If parameters are invalid.
+        """
+        row = self._validate_drop(drop_id, risk_level, rows, landing_position, multiplier)
+        # save_drops counts by rowcount, so an ignored duplicate is neither
+        # counted nor reported as saved
+        if await self.save_drops([row]) == 1:
+            return True
+        logger.debug("Drop %s not saved (duplicate or write error)", drop_id)
+        return False
 
     async def collect_with_playwright(self, demo_url: str) -> None:
         """
         Collect data using Playwright browser automation.
 
         Intercepts WebSocket messages from the game to extract drop data.
-        Implements exponential backoff for reconnection attempts.
+        Implements exponential backoff with full jitter for reconnection attempts.
+        One Chromium process is kept across reconnects; each attempt only opens
+        a new browser context and page.
 
         Args:
             demo_url: URL of the demo game to collect data from.
@@ -291,55 +619,90 @@ class PlinkoCollector:
         Raises:
             ConnectionError: If unable to connect after max retries.
         """
-        logger.info(f"Starting Playwright collection from {demo_url}")
+        logger.info("Starting Playwright collection from %s", demo_url)
 
         retry_count: int = 0
+        sessions: int = 0
+        browser: Optional[Browser] = None
 
-        while self.running and retry_count < self.max_retries:
+        async with async_playwright() as p:
             try:
-                async with async_playwright() as p:
-                    browser = await p.chromium.launch(headless=True)
-                    context = await browser.new_context()
-                    page = await context.new_page()
-
-                    # Set up WebSocket message handler
-                    page.on("websocket", lambda ws: self._setup_websocket_handler(ws))
-
+                while self.running and retry_count < self.max_retries:
                     try:
-                        await page.goto(demo_url, wait_until="networkidle", timeout=60000)
-                        logger.info("Page loaded successfully, monitoring for drops...")
-
-                        # Reset retry count on successful connection
-                        retry_count = 0
-
-                        # Keep collecting while running
-                        while self.running:
-                            await asyncio.sleep(1)
+                        # Reuse the running browser across reconnects; only
+                        # relaunch it if it died or has served enough sessions
+                        if (
+                            browser is None
+                            or not browser.is_connected()
+                            or sessions >= BROWSER_MAX_SESSIONS
+                        ):
+                            if browser is not None:
+                                await browser.close()
+                                logger.info("Browser closed")
+                            browser = await p.chromium.launch(headless=True)
+                            sessions = 0
+                        sessions += 1
+
+                        # A fresh context per session drops the previous
+                        # page's JS heap, caches and listeners
+                        context = await browser.new_context()
+                        try:
+                            page = await context.new_page()
+
+                            # Set up WebSocket message handler
+                            page.on("websocket", self._setup_websocket_handler)
+
+                            try:
+                                await page.goto(demo_url, wait_until="networkidle", timeout=60000)
+                                logger.info("Page loaded successfully, monitoring for drops...")
+
+                                # Reset retry count on successful connection
+                                retry_count = 0
+
+                                # Keep collecting while running
+                                while self.running:
+                                    await asyncio.sleep(1)
+
+                            except Exception as e:
+                                logger.error("Page navigation error: %s", e, exc_info=True)
+                                raise
+
+                        finally:
+                            if browser.is_connected():
+                                await context.close()
 
                     except Exception as e:
-                        logger.error(f"Page navigation error: {e}", exc_info=True)
-                        raise
-
-                    finally:
-                        await browser.close()
-                        logger.info("Browser closed")
-
-            except Exception as e:
-                retry_count += 1
-                wait_time = self.retry_delay * (2 ** (retry_count - 1))  # Exponential backoff
-
-                logger.warning(
-                    f"Collection failed (attempt {retry_count}/{self.max_retries}): {e}. "
-                    f"Retrying in {wait_time:.1f}s..."
-                )
-
-                if retry_count < self.max_retries:
-                    await asyncio.sleep(wait_time)
-                else:
-                    logger.error(f"Max retries ({self.max_retries}) exceeded. Stopping collection.")
-                    raise ConnectionError(
-                        f"Failed to connect after {self.max_retries} attempts"
-                    ) from e
+                        retry_count += 1
+                        # Exponential backoff with full jitter: a random wait below the
+                        # ceiling keeps collectors restarted by the same outage from
+                        # reconnecting in lockstep
+                        ceiling = min(
+                            RETRY_MAX_DELAY_SECONDS,
+                            self.retry_delay * (
+                                1 << min(retry_count - 1, RETRY_BACKOFF_MAX_EXPONENT)
+                            ),
+                        )
+                        wait_time = random.uniform(0, ceiling)
+
+                        logger.warning(
+                            "Collection failed (attempt %d/%d): %s. Retrying in %.1fs...",
+                            retry_count, self.max_retries, e, wait_time
+                        )
+
+                        if retry_count < self.max_retries:
+                            await asyncio.sleep(wait_time)
+                        else:
+                            logger.error(
+                                "Max retries (%d) exceeded. Stopping collection.",
+                                self.max_retries
+                            )
+                            raise ConnectionError(
+                                f"Failed to connect after {self.max_retries} attempts"
+                            ) from e
+            finally:
+                if browser is not None:
+                    await browser.close()
+                    logger.info("Browser closed")
 
     def _setup_websocket_handler(self, ws: WebSocket) -> None:
         """
@@ -348,32 +711,46 @@ class PlinkoCollector:
         Args:
             ws: Playwright WebSocket object.
         """
-        logger.info(f"WebSocket connected: {ws.url}")
+        logger.info("WebSocket connected: %s", ws.url)
 
-        def on_message(payload: str) -> None:
+        def on_message(payload: Union[str, bytes]) -> None:
             """Handle incoming WebSocket message."""
             try:
                 self._process_websocket_message(payload)
             except Exception as e:
-                logger.error(f"Error processing WebSocket message: {e}", exc_info=True)
+                logger.error("Error processing WebSocket message: %s", e, exc_info=True)
 
-        ws.on("framereceived", lambda payload: on_message(payload))
-        ws.on("close", lambda: logger.info(f"WebSocket closed: {ws.url}"))
+        ws.on("framereceived", on_message)
+        ws.on("close", lambda: logger.info("WebSocket closed: %s", ws.url))
 
-    def _process_websocket_message(self, message: str) -> None:
+    def _process_websocket_message(self, message: Union[str, bytes]) -> None:
         """
         Process a raw WebSocket message.
 
+        Text and binary frames are both handed to orjson as-is; orjson
+        parses bytes directly, so binary frames are not decoded first.
+
         Args:
-            message: Raw WebSocket message string.
+            message: Raw WebSocket message (text or binary frame payload).
         """
+        if isinstance(message, str):
+            if not MULTIPLIER_KEY_RE.search(message):
+                return
+        elif isinstance(message, (bytes, bytearray, memoryview)):
+            if not MULTIPLIER_KEY_BYTES_RE.search(message):
+                return
+
         try:
-            data = json.loads(message) if isinstance(message, str) else message
+            data = (
+                orjson.loads(message)
+                if isinstance(message, (str, bytes, bytearray, memoryview))
+                else message
+            )
             self.parse_ws_message(data)
-        except json.JSONDecodeError as e:
-            logger.debug(f"Non-JSON message received: {message[:100]}...")
+        except orjson.JSONDecodeError as e:
+            logger.debug("Non-JSON message received: %s...", message[:100])
         except Exception as e:
-            logger.error(f"Failed to process message: {e}", exc_info=True)
+            logger.error("Failed to process message: %s", e, exc_info=True)
 
     def parse_ws_message(self, data: Union[Dict[str, Any], List, Any]) -> None:
         """
@@ -390,216 +767,266 @@ class PlinkoCollector:
             This implementation handles common patterns found in Plinko games.
         """
         if not isinstance(data, dict):
-            logger.debug(f"Skipping non-dict message: {type(data)}")
+            logger.debug("Skipping non-dict message: %s", type(data))
             return
 
         # Check if this is a drop-end message
         msg_type = self._extract_message_type(data)
         if msg_type and msg_type.lower() not in END_MESSAGE_TYPES:
-            logger.debug(f"Skipping non-end message type: {msg_type}")
+            logger.debug("Skipping non-end message type: %s", msg_type)
             return
 
+        fields = self._extract_fields(data)
+
         # Extract required fields
-        multiplier = self._extract_multiplier(data)
+        multiplier = fields.get('multiplier')
         if multiplier is None:
             logger.debug("No multiplier found in message")
             return
 
-        landing_position = self._extract_landing_position(data)
+        landing_position = fields.get('landing_position')
         if landing_position is None:
             logger.debug("No landing position found in message")
             return
 
-        # Validate required values
+        # Validate required values; _extract_fields has already converted
+        # every field to its column type, so the row is built directly
+        # rather than re-coerced through _validate_drop
         if multiplier <= 0:
-            logger.warning(f"Invalid multiplier value: {multiplier}")
+            logger.warning("Invalid multiplier value: %s", multiplier)
             return
 
         if landing_position < 0:
-            logger.warning(f"Invalid landing position: {landing_position}")
+            logger.warning("Invalid landing position: %s", landing_position)
             return
 
         # Extract optional fields with defaults
-        drop_id = self._extract_drop_id(data)
+        drop_id = fields.get('drop_id')
         if drop_id is None:
             # Generate a drop ID if not found
-            drop_id = f"plinko_{datetime.now().timestamp()}"
-            logger.debug(f"Generated drop_id: {drop_id}")
+            drop_id = f"plinko_{time.time_ns()}"
+            logger.debug("Generated drop_id: %s", drop_id)
 
-        risk_level = self._extract_risk_level(data)
+        risk_level = fields.get('risk_level')
         if risk_level is None:
             risk_level = "medium"
             logger.debug("No risk level found, defaulting to 'medium'")
 
-        rows = self._extract_rows(data)
+        risk_id = RISK_LEVEL_IDS.get(risk_level)
+        if risk_id is None:
+            logger.warning("Unknown risk level '%s', defaulting to 'medium'", risk_level)
+            risk_id = RISK_LEVEL_IDS['medium']
+
+        rows = fields.get('rows')
         if rows is None:
             rows = 12
             logger.debug("No rows found, defaulting to 12")
+        elif rows <= 0:
+            logger.warning("Invalid rows value: %s", rows)
+            return
 
-        # Save the drop asynchronously
-        asyncio.create_task(
-            self.save_drop(
-                str(drop_id),
-                str(risk_level),
-                int(rows),
-                int(landing_position),
-                float(multiplier)
-            )
-        )
+        # Hand the drop to the writer thread
+        self._enqueue_drop((drop_id, risk_id, rows, landing_position, multiplier))
 
-    def _extract_message_type(self, data: Dict[str, Any]) -> Optional[str]:
+    def _enqueue_drop(self, drop: Tuple[str, int, int, int, float]) -> None:
         """
-        Extract message type from data dictionary.
+        Queue a drop for the writer thread, evicting the oldest when full.
 
-        Args:
-            data: Message data dictionary.
-
-        Returns:
-            Optional[str]: Message type if found, None otherwise.
-        """
-        for field in ['type', 't', 'action', 'event', 'messageType', 'cmd']:
-            if field in data:
-                return str(data[field])
-        return None
-
-    def _extract_multiplier(self, data: Dict[str, Any]) -> Optional[float]:
-        """
-        Extract multiplier value from data dictionary.
+        For a live tracker the newest drops matter most, so a full queue
+        sheds its stale head rather than the drop that just arrived.
 
         Args:
-            data: Message data dictionary.
-
-        Returns:
-            Optional[float]: Multiplier value if found and valid, None otherwise.
+            drop: Row ready for INSERT.
         """
-        for field in MULTIPLIER_FIELDS:
-            if field in data:
-                try:
-                    value = data[field]
-                    if isinstance(value, (int, float)):
-                        return float(value)
-                    elif isinstance(value, str):
-                        return float(value)
-                except (ValueError, TypeError) as e:
-                    logger.debug(f"Failed to convert {field}={data[field]} to float: {e}")
-                    continue
+        if self._closing:
+            logger.debug("Writer is stopping, dropping %s", drop[0])
+            return
 
-        # Check nested structures
-        if 'result' in data and isinstance(data['result'], dict):
-            return self._extract_multiplier(data['result'])
+        while True:
+            try:
+                self._queue.put_nowait(drop)
+                return
+            except queue.Full:
+                pass
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                # The writer drained the queue in between; just retry
+                continue
+            self._count_discarded()
 
-        if 'data' in data and isinstance(data['data'], dict):
-            return self._extract_multiplier(data['data'])
+    def _count_discarded(self) -> None:
+        """
+        Count an evicted drop and report evictions at a limited rate.
 
-        return None
+        Logs how many drops were evicted since the previous report, at most
+        once per DROP_WARNING_INTERVAL_SECONDS, so a burst against a stalled
+        database does not also flood the log. run() reports the total.
+        """
+        self.drops_discarded += 1
+        self._discarded_since_warning += 1
+        now = time.monotonic()
+        if now - self._last_discard_warning >= DROP_WARNING_INTERVAL_SECONDS:
+            logger.warning(
+                "Drop queue full (%d pending): evicted %d oldest drops, total_discarded=%d",
+                DROP_QUEUE_MAXSIZE, self._discarded_since_warning, self.drops_discarded
+            )
+            self._last_discard_warning = now
+            self._discarded_since_warning = 0
 
-    def _extract_landing_position(self, data: Dict[str, Any]) -> Optional[int]:
+    def _extract_message_type(self, data: Dict[str, Any]) -> Optional[str]:
         """
-        Extract landing position from data dictionary.
+        Extract message type from data dictionary.
 
         Args:
             data: Message data dictionary.
 
         Returns:
-            Optional[int]: Landing position if found and valid, None otherwise.
+            Optional[str]: Message type if found, None otherwise.
         """
-        for field in POSITION_FIELDS:
+        for field in MESSAGE_TYPE_FIELDS:
             if field in data:
-                try:
-                    value = data[field]
-                    if isinstance(value, (int, float)):
-                        return int(value)
-                    elif isinstance(value, str):
-                        return int(value)
-                except (ValueError, TypeError) as e:
-                    logger.debug(f"Failed to convert {field}={data[field]} to int: {e}")
-                    continue
-
-        # Check nested structures
-        if 'result' in data and isinstance(data['result'], dict):
-            return self._extract_landing_position(data['result'])
-
-        if 'data' in data and isinstance(data['data'], dict):
-            return self._extract_landing_position(data['data'])
-
+                return str(data[field])
         return None
 
-    def _extract_drop_id(self, data: Dict[str, Any]) -> Optional[str]:
+    def _extract_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Extract drop ID from data dictionary.
+        Extract every drop field, via the learned fast path when it applies.
+
+        The game sends one consistent schema, so after the first clean parse
+        most frames have exactly the learned shape and resolve with a few
+        direct lookups. Anything else goes through _extract_all, which
+        re-learns the shape (or forgets it if the frame was not clean).
 
         Args:
             data: Message data dictionary.
 
         Returns:
-            Optional[str]: Drop ID if found, None otherwise.
+            Dict[str, Any]: Converted values keyed by field name.
         """
-        for field in DROP_ID_FIELDS:
-            if field in data:
-                return str(data[field])
+        if self._fast_path is not None:
+            found = self._extract_with_path(data, self._fast_path)
+            if found is not None:
+                return found
 
-        # Check nested structures
-        if 'result' in data and isinstance(data['result'], dict):
-            return self._extract_drop_id(data['result'])
-
-        if 'data' in data and isinstance(data['data'], dict):
-            return self._extract_drop_id(data['data'])
-
-        return None
+        found, self._fast_path = self._extract_all(data)
+        return found
 
-    def _extract_risk_level(self, data: Dict[str, Any]) -> Optional[str]:
+    def _extract_with_path(
+        self,
+        data: Dict[str, Any],
+        path: FramePath
+    ) -> Optional[Dict[str, Any]]:
         """
-        Extract risk level from data dictionary.
+        Extract drop fields from a frame shaped like a learned one.
 
         Args:
             data: Message data dictionary.
+            path: Shape learned by _extract_all.
 
         Returns:
-            Optional[str]: Risk level if found, None otherwise.
+            Optional[Dict[str, Any]]: Converted values keyed by field name, or
+            None if the frame's shape or values differ and the generic
+            extraction must run instead.
         """
-        for field in RISK_LEVEL_FIELDS:
-            if field in data:
-                return str(data[field]).lower()
-
-        # Check nested structures
-        if 'result' in data and isinstance(data['result'], dict):
-            return self._extract_risk_level(data['result'])
-
-        if 'data' in data and isinstance(data['data'], dict):
-            return self._extract_risk_level(data['data'])
-
-        return None
+        key_sets, complete, guards, picks = path
+        levels: List[Dict[str, Any]] = []
+        level: Any = data
+
+        # Descend exactly as _extract_all would, checking each level's keys
+        for key_set in key_sets:
+            if not isinstance(level, dict) or level.keys() != key_set:
+                return None
+            levels.append(level)
+            nested = level.get('result')
+            level = nested if isinstance(nested, dict) else level.get('data')
+        if not complete and isinstance(level, dict):
+            return None
+
+        # A skipped candidate that now holds a scalar could outrank the pick
+        for depth, key, types in guards:
+            if isinstance(levels[depth][key], types):
+                return None
+
+        found: Dict[str, Any] = {}
+        for depth, key, name, convert, types in picks:
+            value = levels[depth][key]
+            if not isinstance(value, types):
+                return None
+            try:
+                found[name] = convert(value)
+            except (ValueError, TypeError):
+                return None
+        return found
 
-    def _extract_rows(self, data: Dict[str, Any]) -> Optional[int]:
+    def _extract_all(
+        self,
+        data: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[FramePath]]:
         """
-        Extract number of rows from data dictionary.
+        Extract every drop field from a message in a single pass.
+
+        Each nesting level (the message, then its 'result' dict, or failing
+        that its 'data' dict) is walked once for all fields, looking each key
+        up in FIELD_LOOKUP, instead of probing every candidate name of every
+        field and re-walking the nested dicts once per field. Within a level
+        the highest-priority candidate that converts wins; fields not found
+        at a level are looked for one level down.
 
         Args:
             data: Message data dictionary.
 
         Returns:
-            Optional[int]: Number of rows if found and valid, None otherwise.
+            Tuple[Dict[str, Any], Optional[FramePath]]: Converted values keyed
+            by field name (fields that could not be found are left out), and
+            the frame's shape for the fast path, or None if any candidate
+            value failed to convert.
         """
-        for field in ROWS_FIELDS:
-            if field in data:
+        found: Dict[str, Any] = {}
+        picks: Dict[str, Tuple[int, str, str, Callable[[Any], Any], Any]] = {}
+        guards: List[Tuple[int, str, Any]] = []
+        levels: List[Dict[str, Any]] = []
+        clean = True
+        complete = False
+        level: Any = data
+
+        while isinstance(level, dict):
+            depth = len(levels)
+            levels.append(level)
+            # Priority of the candidate each field was taken from at this level
+            ranks: Dict[str, int] = {}
+
+            for key, value in level.items():
+                hit = FIELD_LOOKUP.get(key)
+                if hit is None:
+                    continue
+                name, rank, convert, types = hit
+                # Fields resolved at an outer level have no rank here and are final
+                if name in found and ranks.get(name, -1) <= rank:
+                    continue
+                if not isinstance(value, types):
+                    guards.append((depth, key, types))
+                    continue
                 try:
-                    value = data[field]
-                    if isinstance(value, (int, float)):
-                        return int(value)
-                    elif isinstance(value, str):
-                        return int(value)
+                    found[name] = convert(value)
+                    ranks[name] = rank
+                    picks[name] = (depth, key, name, convert, types)
                 except (ValueError, TypeError) as e:
-                    logger.debug(f"Failed to convert {field}={data[field]} to int: {e}")
-                    continue
+                    clean = False
+                    logger.debug("Failed to convert %s=%s for %s: %s", key, value, name, e)
 
-        # Check nested structures
-        if 'result' in data and isinstance(data['result'], dict):
-            return self._extract_rows(data['result'])
+            if len(found) == EXTRACTED_FIELD_COUNT:
+                complete = True
+                break
 
-        if 'data' in data and isinstance(data['data'], dict):
-            return self._extract_rows(data['data'])
+            # Check nested structures
+            nested = level.get('result')
+            level = nested if isinstance(nested, dict) else level.get('data')
 
-        return None
+        if not clean:
+            return found, None
+        key_sets = tuple(frozenset(level) for level in levels)
+        return found, (key_sets, complete, tuple(guards), tuple(picks.values()))
 
     async def generate_test_data(self, count: int = 100) -> None:
         """
@@ -611,9 +1038,7 @@ class PlinkoCollector:
         Args:
             count: Number of test drops to generate.
         """
-        import random
-
-        logger.info(f"Generating {count} test drops...")
+        logger.info("Generating %s test drops...", count)
 
         # Plinko payout tables (99% RTP)
         PLINKO_PAYOUTS = {
@@ -634,36 +1059,43 @@ class PlinkoCollector:
             }
         }
 
-        risk_levels = ["low", "medium", "high"]
         row_options = [8, 12, 16]
 
-        for i in range(count):
-            # Random configuration
-            risk_level = random.choice(risk_levels)
-            rows = random.choice(row_options)
-
-            # Simulate binomial distribution for landing position
-            # Each peg has 50/50 chance to go left or right
-            position = 0
-            for _ in range(rows):
-                if random.random() < 0.5:
-                    position += 1
-
-            # Get multiplier from payout table
-            payouts = PLINKO_PAYOUTS[risk_level][rows]
-            multiplier = payouts[position]
-
-            drop_id = f"test_{datetime.now().timestamp()}_{i}"
-
-            try:
-                await self.save_drop(drop_id, risk_level, rows, position, multiplier)
-            except ValueError as e:
-                logger.warning(f"Skipping invalid test drop: {e}")
-
-            # Small delay to avoid overwhelming the database
-            await asyncio.sleep(0.01)
-
-        logger.info(f"Test data generation complete: {count} drops created")
+        # Payouts as one [risk_id, row option, position] array (narrower boards
+        # are zero-padded) so every multiplier is looked up in a single gather
+        payout_table = np.zeros((len(RISK_LEVEL_NAMES), len(row_options), max(row_options) + 1))
+        for risk_id, risk_level in enumerate(RISK_LEVEL_NAMES):
+            for row_idx, rows in enumerate(row_options):
+                payouts = PLINKO_PAYOUTS[risk_level][rows]
+                payout_table[risk_id, row_idx, :len(payouts)] = payouts
+
+        # Random configuration per drop
+        rng = np.random.default_rng()
+        risk_ids = rng.integers(0, len(RISK_LEVEL_NAMES), size=count)
+        row_idxs = rng.integers(0, len(row_options), size=count)
+        rows = np.asarray(row_options)[row_idxs]
+
+        # Each peg is a 50/50 left/right bounce, so the landing position is
+        # Binomial(rows, 0.5)
+        positions = rng.binomial(rows, 0.5)
+        multipliers = payout_table[risk_ids, row_idxs, positions]
+
+        # Rows are generated valid, so they skip _validate_drop; tolist()
+        # hands sqlite3 plain Python ints and floats
+        id_prefix = f"test_{time.time_ns()}"
+        drops = list(zip(
+            (f"{id_prefix}_{i}" for i in range(count)),
+            risk_ids.tolist(),
+            rows.tolist(),
+            positions.tolist(),
+            multipliers.tolist(),
+        ))
+
+        # Each batch is awaited, which already yields to the event loop and
+        # paces generation to what the database accepts
+        for start in range(0, len(drops), DROP_BATCH_SIZE):
+            await self.save_drops(drops[start:start + DROP_BATCH_SIZE])
+        logger.info("Test data generation complete: %s drops created", count)
 
     async def run(
         self,
@@ -687,33 +1119,41 @@ class PlinkoCollector:
 
         await self.init_db()
         self.running = True
+        self._start_writer()
 
         try:
             if test_mode:
                 logger.info("Running in test mode - generating test data")
                 await self.generate_test_data(1000)
             elif demo_url:
-                logger.info(f"Collecting from demo URL: {demo_url}")
+                logger.info("Collecting from demo URL: %s", demo_url)
                 await self.collect_with_playwright(demo_url)
             else:
                 error_msg = "No demo URL provided and not in test mode"
                 logger.error(error_msg)
                 raise ValueError(error_msg)
         except Exception as e:
-            logger.error(f"Collection failed: {e}", exc_info=True)
+            logger.error("Collection failed: %s", e, exc_info=True)
             raise
         finally:
             self.running = False
+            await self._stop_writer()
+            await self.close()
             logger.info(
-                f"Collector stopped. Total drops collected: {self.drops_collected}"
+                "Collector stopped. Total drops collected: %d", self.drops_collected
             )
+            if self.drops_discarded:
+                logger.warning(
+                    "%d drops were evicted from the full write queue", self.drops_discarded
+                )
 
     def stop(self) -> None:
         """
         Stop the collector gracefully.
 
         Sets the running flag to False, which will cause the collection
-        loop to exit on its next iteration.
+        loop to exit on its next iteration. Drops already queued are still
+        written before run() returns.
         """
         logger.info("Stop requested - collector will shut down gracefully")
         self.running = False
@@ -728,33 +1168,38 @@ async def main() -> None:
     Main entry point for the collector.
 
     Parses command line arguments and starts the collector in either
-    test mode or live collection mode.
+    test mode or live collection mode. Log output is written from a
+    listener thread for as long as the collector runs.
     """
-    import sys
-
-    collector = PlinkoCollector()
+    listener = start_log_listener(logger)
+    try:
+        collector = PlinkoCollector()
 
-    # Check for test mode flag
-    test_mode = "--test" in sys.argv
+        # Check for test mode flag
+        test_mode = "--test" in sys.argv
 
-    if test_mode:
-        logger.info("Starting in test mode")
-        await collector.run(test_mode=True)
-    else:
-        # Try to collect from BGaming demo
-        demo_url = os.getenv("DEMO_URL", "https://demo.bgaming.com/plinko")
-        logger.info(f"Starting collection from: {demo_url}")
-        logger.info("Note: This may require additional configuration based on BGaming's demo structure")
+        if test_mode:
+            logger.info("Starting in test mode")
+            await collector.run(test_mode=True)
+        else:
+            # Try to collect from BGaming demo
+            demo_url = os.getenv("DEMO_URL", "https://demo.bgaming.com/plinko")
+            logger.info("Starting collection from: %s", demo_url)
+            logger.info("Note: This may require additional configuration based on BGaming's demo structure")
 
-        try:
-            await collector.run(demo_url=demo_url)
-        except KeyboardInterrupt:
-            logger.info("Received keyboard interrupt")
-            collector.stop()
-        except Exception as e:
-            logger.error(f"Collector failed: {e}", exc_info=True)
-            raise
+            try:
+                await collector.run(demo_url=demo_url)
+            except KeyboardInterrupt:
+                logger.info("Received keyboard interrupt")
+                collector.stop()
+            except Exception as e:
+                logger.error("Collector failed: %s", e, exc_info=True)
+                raise
+    finally:
+        stop_log_listener(logger, listener)
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
@@ -0,0 +1,293 @@
+"""
+Plinko Tracker - Database Schema
+
+Single definition of the SQLite schema shared by the API and the collector.
+The collector (or an explicit ``python plinko_schema.py [db_path]``) is the
+only side that migrates it; the API only creates it on a new database.
+
+Author: Crash Games Team
+Version: 1.0.0
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Schema Definition
+# =============================================================================
+
+# Stored in PRAGMA user_version once migrate() has brought a database up to
+# this schema; bump it whenever the DDL below changes
+SCHEMA_VERSION: int = 1
+
+# created_at is stored as Unix epoch milliseconds: integer comparisons and
+# index entries are cheaper than ISO text. It is formatted back to ISO only
+# in responses
+EPOCH_MS_NOW_SQL: str = "CAST(ROUND((julianday('now') - 2440587.5) * 86400000) AS INTEGER)"
+
+# risk_level is stored as a small integer referencing risk_levels; the
+# names are only joined back in for responses
+RISK_LEVEL_NAMES: Tuple[str, ...] = ("low", "medium", "high")
+RISK_LEVEL_IDS: Dict[str, int] = {name: i for i, name in enumerate(RISK_LEVEL_NAMES)}
+
+RISK_LEVELS_DDL: str = """
+    CREATE TABLE IF NOT EXISTS risk_levels (
+        id INTEGER PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL
+    )
+"""
+
+RISK_LEVELS_SEED_SQL: str = "INSERT OR IGNORE INTO risk_levels (id, name) VALUES " + ", ".join(
+    f"({i}, '{name}')" for i, name in enumerate(RISK_LEVEL_NAMES)
+)
+
+PLINKO_ROUNDS_DDL: str = f"""
+    CREATE TABLE IF NOT EXISTS plinko_rounds (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        drop_id TEXT UNIQUE NOT NULL,
+        risk_level INTEGER NOT NULL REFERENCES risk_levels(id),
+        rows INTEGER NOT NULL,
+        landing_position INTEGER NOT NULL,
+        multiplier REAL NOT NULL,
+        created_at INTEGER NOT NULL DEFAULT ({EPOCH_MS_NOW_SQL})
+    )
+"""
+
+# Rebuilds a table created with the older text columns (created_at as
+# CURRENT_TIMESTAMP text, risk_level as a name; unknown names become medium).
+# Indexes and triggers go with the old table and are recreated right after,
+# in the same transaction
+LEGACY_SCHEMA_MIGRATION_SQL: List[str] = [
+    "ALTER TABLE plinko_rounds RENAME TO plinko_rounds_legacy",
+    PLINKO_ROUNDS_DDL,
+    f"""
+    INSERT INTO plinko_rounds
+        (id, drop_id, risk_level, rows, landing_position, multiplier, created_at)
+    SELECT id, drop_id,
+           CASE WHEN typeof(risk_level) = 'integer' THEN risk_level ELSE COALESCE(
+               (SELECT r.id FROM risk_levels r WHERE r.name = lower(risk_level)),
+               {RISK_LEVEL_IDS['medium']}
+           ) END,
+           rows, landing_position, multiplier,
+           CASE WHEN typeof(created_at) = 'integer' THEN created_at ELSE COALESCE(
+               CAST(ROUND((julianday(created_at) - 2440587.5) * 86400000) AS INTEGER),
+               {EPOCH_MS_NOW_SQL}
+           ) END
+    FROM plinko_rounds_legacy
+    """,
+    "DROP TABLE plinko_rounds_legacy",
+]
+
+INDEXES_DDL: List[str] = [
+    "CREATE INDEX IF NOT EXISTS idx_multiplier ON plinko_rounds(multiplier)",
+    # Newest-first pages and keyset cursors for /api/drops
+    "CREATE INDEX IF NOT EXISTS idx_created_id ON plinko_rounds(created_at DESC, id DESC)",
+    # Per-risk windows read by game_stats (risk_level = ? AND created_at >= ?,
+    # newest first)
+    "CREATE INDEX IF NOT EXISTS idx_risk_created ON plinko_rounds(risk_level, created_at DESC)",
+]
+
+# idx_created is superseded by idx_created_id. The others are write-only
+# overhead: drop_id already has its UNIQUE index, risk_level is covered by
+# idx_risk_created and nothing filters on rows
+DROPPED_INDEXES: Tuple[str, ...] = ("idx_created", "idx_drop_id", "idx_risk_level", "idx_rows")
+
+# Running row count so /api/drops never needs COUNT(*). Triggers go in
+# before the seed so no insert is missed or counted twice
+DROPS_COUNTER_DDL: List[str] = [
+    "CREATE TABLE IF NOT EXISTS plinko_meta (k TEXT PRIMARY KEY, v INTEGER NOT NULL)",
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_plinko_rounds_count_insert
+    AFTER INSERT ON plinko_rounds BEGIN
+        UPDATE plinko_meta SET v = v + 1 WHERE k = 'drops_total';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_plinko_rounds_count_delete
+    AFTER DELETE ON plinko_rounds BEGIN
+        UPDATE plinko_meta SET v = v - 1 WHERE k = 'drops_total';
+    END
+    """,
+    "INSERT OR IGNORE INTO plinko_meta (k, v) "
+    "VALUES ('drops_total', (SELECT COUNT(*) FROM plinko_rounds))",
+]
+
+# How long migrate_path() waits for another migrator's write lock
+MIGRATION_BUSY_TIMEOUT_MS: int = 30000
+
+
+# =============================================================================
+# Migration
+# =============================================================================
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """
+    Return the schema version recorded in the database.
+
+    Args:
+        conn: Open connection to the database.
+
+    Returns:
+        int: PRAGMA user_version (0 for a new or pre-versioning database).
+    """
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _apply_schema(conn: sqlite3.Connection) -> None:
+    """
+    Run every schema statement inside the caller's transaction.
+
+    All of it is idempotent, so on a new database it simply creates the
+    tables, indexes and counter.
+
+    Args:
+        conn: Connection with a write transaction open.
+    """
+    conn.execute(RISK_LEVELS_DDL)
+    conn.execute(RISK_LEVELS_SEED_SQL)
+    conn.execute(PLINKO_ROUNDS_DDL)
+
+    # Convert databases that still store created_at/risk_level as text
+    columns = conn.execute("PRAGMA table_info(plinko_rounds)").fetchall()
+    if any(
+        col[1] in ("created_at", "risk_level") and col[2] != "INTEGER"
+        for col in columns
+    ):
+        logger.warning("Migrating plinko_rounds to the integer column schema")
+        for statement in LEGACY_SCHEMA_MIGRATION_SQL:
+            conn.execute(statement)
+
+    for statement in INDEXES_DDL:
+        conn.execute(statement)
+    for index in DROPPED_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {index}")
+    for statement in DROPS_COUNTER_DDL:
+        conn.execute(statement)
+
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def _apply_schema_if(conn: sqlite3.Connection, needed: Callable[[], bool]) -> bool:
+    """
+    Apply the schema in one BEGIN IMMEDIATE transaction if needed() holds.
+
+    needed() is evaluated after the write lock is taken: concurrent callers
+    serialize, and the later one finds the work done and changes nothing.
+    Writers never see the table without its counter triggers.
+
+    Args:
+        conn: Connection in autocommit mode (isolation_level=None).
+        needed: Checked under the lock; False leaves the database untouched.
+
+    Returns:
+        bool: True if the schema was changed.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if not needed():
+            conn.execute("ROLLBACK")
+            return False
+        _apply_schema(conn)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return True
+
+
+def migrate(conn: sqlite3.Connection) -> bool:
+    """
+    Create or upgrade the schema to SCHEMA_VERSION.
+
+    Args:
+        conn: Connection in autocommit mode (isolation_level=None).
+
+    Returns:
+        bool: True if the schema was changed, False if it was already current.
+    """
+    return _apply_schema_if(conn, lambda: schema_version(conn) < SCHEMA_VERSION)
+
+
+def create_if_missing(conn: sqlite3.Connection) -> bool:
+    """
+    Create the schema on a new database, leaving existing ones untouched.
+
+    Safe for the API to call at startup: a database that already has
+    plinko_rounds, at whatever version, is left for migrate() to upgrade.
+
+    Args:
+        conn: Connection in autocommit mode (isolation_level=None).
+
+    Returns:
+        bool: True if the schema was created.
+    """
+    return _apply_schema_if(
+        conn,
+        lambda: schema_version(conn) == 0 and conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'plinko_rounds'"
+        ).fetchone() is None,
+    )
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """
+    Open db_path in autocommit mode for a schema change, switched to WAL.
+
+    Args:
+        db_path: Path to the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: Connection that waits for other writers' locks.
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute(f"PRAGMA busy_timeout={MIGRATION_BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
+
+
+def migrate_path(db_path: str) -> bool:
+    """
+    Open the database at db_path, switch it to WAL and migrate it.
+
+    Args:
+        db_path: Path to the SQLite database file.
+
+    Returns:
+        bool: True if the schema was changed, False if it was already current.
+    """
+    conn = _connect(db_path)
+    try:
+        return migrate(conn)
+    finally:
+        conn.close()
+
+
+def create_if_missing_path(db_path: str) -> bool:
+    """
+    Open the database at db_path and create the schema if it is new.
+
+    Args:
+        db_path: Path to the SQLite database file.
+
+    Returns:
+        bool: True if the schema was created.
+    """
+    conn = _connect(db_path)
+    try:
+        return create_if_missing(conn)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    path = sys.argv[1] if len(sys.argv) > 1 else os.getenv("DATABASE_PATH", "plinko.db")
+    changed = migrate_path(path)
+    logger.info("%s schema version %d: %s", path, SCHEMA_VERSION, "migrated" if changed else "up to date")
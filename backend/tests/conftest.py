@@ -0,0 +1,69 @@
+"""
+Shared fixtures for the backend tests.
+
+The API and the collector are run as scripts from their own directories,
+so their directories (and backend/, for plinko_schema) go on sys.path here
+the same way.
+"""
+
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Tuple
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (BACKEND_DIR, os.path.join(BACKEND_DIR, "api"), os.path.join(BACKEND_DIR, "collector")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import plinko_schema  # noqa: E402
+
+# (drop_id, risk_level id, rows, landing_position, multiplier, created_at ms)
+DropRow = Tuple[str, int, int, int, float, int]
+
+
+def insert_drops(db_path: str, drops: Iterable[DropRow]) -> None:
+    """Insert drop rows directly, bypassing the collector."""
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO plinko_rounds "
+            "(drop_id, risk_level, rows, landing_position, multiplier, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            drops,
+        )
+    conn.close()
+
+
+@pytest.fixture
+def db_path(tmp_path) -> str:
+    """Path to an empty database migrated to the current schema."""
+    path = str(tmp_path / "plinko.db")
+    plinko_schema.migrate_path(path)
+    return path
+
+
+@contextmanager
+def api_client(db_path: str, monkeypatch) -> Iterator["TestClient"]:
+    """Run the API against db_path (startup to shutdown) with response caching off."""
+    from fastapi.testclient import TestClient
+
+    import game_stats
+    import main
+
+    monkeypatch.setattr(main.db_manager, "db_path", db_path)
+    monkeypatch.setattr(game_stats, "STATS_CACHE_TTL_SECONDS", 0)
+    main._agg_cache.clear()
+    main._agg_locks.clear()
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def client(db_path, monkeypatch) -> Iterator["TestClient"]:
+    """TestClient for the API, pointed at the migrated db_path."""
+    with api_client(db_path, monkeypatch) as test_client:
+        yield test_client
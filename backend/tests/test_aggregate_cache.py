@@ -0,0 +1,48 @@
+"""Concurrent cache misses must compute each aggregate once."""
+
+import asyncio
+
+import main
+from conftest import insert_drops
+from main import DatabaseManager
+
+
+class _CountingDb:
+    """Wraps the API connection and counts aggregate queries."""
+
+    def __init__(self, db):
+        self.db = db
+        self.queries = 0
+
+    async def execute_fetchall(self, *args):
+        self.queries += 1
+        # Keep the query in flight long enough for every request to miss
+        await asyncio.sleep(0.05)
+        return await self.db.execute_fetchall(*args)
+
+
+def test_concurrent_misses_share_one_query(db_path, monkeypatch):
+    insert_drops(db_path, [(f"d{i}", 1, 16, 3, 1.5 + i, 1_000 + i) for i in range(5)])
+    monkeypatch.setattr(main, "AGG_CACHE_TTL_SECONDS", 60.0)
+    main._agg_cache.clear()
+    main._agg_locks.clear()
+
+    async def run():
+        manager = DatabaseManager(db_path)
+        try:
+            db = _CountingDb(await manager.open())
+            responses = await asyncio.gather(
+                *(main.get_distribution(db=db) for _ in range(5)),
+                *(main.get_summary(db=db) for _ in range(5)),
+            )
+            return db.queries, responses
+        finally:
+            await manager.close()
+            main._agg_cache.clear()
+            main._agg_locks.clear()
+
+    queries, responses = asyncio.run(run())
+
+    assert queries == 2
+    assert len({response.body for response in responses[:5]}) == 1
+    assert len({response.body for response in responses[5:]}) == 1
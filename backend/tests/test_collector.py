@@ -0,0 +1,256 @@
+"""Tests for the Plinko collector."""
+
+import asyncio
+import logging
+import logging.handlers
+import queue
+import sqlite3
+import threading
+
+import pytest
+
+import plinko_collector
+from plinko_schema import RISK_LEVEL_IDS
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((threading.current_thread().name, record.getMessage()))
+
+
+def test_import_leaves_logging_synchronous():
+    handlers = plinko_collector.logger.handlers
+
+    assert handlers
+    assert not any(isinstance(h, logging.handlers.QueueHandler) for h in handlers)
+
+
+def test_log_listener_writes_off_thread_and_restores_handlers():
+    logger = logging.getLogger("plinko_collector_test_listener")
+    logger.propagate = False
+    target = _ListHandler()
+    logger.addHandler(target)
+
+    listener = plinko_collector.start_log_listener(logger)
+    logger.warning("drop %s", 1)
+    plinko_collector.stop_log_listener(logger, listener)
+
+    assert logger.handlers == [target]
+    assert len(target.records) == 1
+    thread_name, message = target.records[0]
+    assert message == "drop 1"
+    assert thread_name != threading.current_thread().name
+
+
+def test_full_queue_evicts_the_oldest_drops(tmp_path):
+    collector = plinko_collector.PlinkoCollector(db_path=str(tmp_path / "plinko.db"))
+    collector._queue = queue.Queue(maxsize=3)
+
+    for i in range(5):
+        collector.parse_ws_message({"id": f"d{i}", "multiplier": 1.5, "slot": 3})
+
+    queued = [collector._queue.get_nowait()[0] for _ in range(collector._queue.qsize())]
+    assert queued == ["d2", "d3", "d4"]
+    assert collector.drops_discarded == 2
+
+
+
+def test_drops_after_stop_cannot_evict_the_sentinel(db_path):
+    collector = plinko_collector.PlinkoCollector(db_path=db_path)
+    collector._queue = queue.Queue(maxsize=2)
+    gate = threading.Event()
+
+    def stalled_writer(loop):
+        gate.wait()
+        collector._write_batches(loop)
+
+    async def run():
+        await collector.init_db()
+        # A writer that is stalled until the queue holds the sentinel
+        collector._writer = threading.Thread(
+            target=stalled_writer,
+            args=(asyncio.get_running_loop(),),
+            daemon=True,
+        )
+        collector._writer.start()
+        collector.parse_ws_message({"id": "kept", "multiplier": 1.5, "slot": 3})
+
+        stopping = asyncio.create_task(collector._stop_writer())
+        while not collector._queue.full():
+            await asyncio.sleep(0.001)
+        for i in range(5):
+            collector.parse_ws_message({"id": f"late{i}", "multiplier": 1.5, "slot": 3})
+        gate.set()
+        done, _ = await asyncio.wait({stopping}, timeout=5)
+        if not done:
+            # Release the writer so the test fails instead of hanging
+            collector._queue.put(None, timeout=1)
+        await stopping
+        await asyncio.sleep(0)
+        await collector.close()
+        return bool(done)
+
+    assert asyncio.run(run())
+
+    assert collector.drops_collected == 1
+    assert collector.drops_discarded == 0
+    assert collector._queue.empty()
+
+def test_writer_thread_saves_queued_drops(db_path):
+    collector = plinko_collector.PlinkoCollector(db_path=db_path)
+    # Every other id repeats, so 60 of the 120 frames are duplicates
+    frames = [
+        {"id": f"w{i // 2}", "multiplier": 1.5, "slot": i % 16, "risk": "high", "rows": 16}
+        for i in range(120)
+    ]
+
+    async def run():
+        await collector.init_db()
+        collector._start_writer()
+        for frame in frames:
+            collector.parse_ws_message(frame)
+        await collector._stop_writer()
+        # _count_saved is scheduled from the writer thread
+        await asyncio.sleep(0)
+        await collector.close()
+
+    asyncio.run(run())
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(DISTINCT drop_id), COUNT(*) FROM plinko_rounds").fetchone() == (60, 60)
+        assert conn.execute("SELECT v FROM plinko_meta WHERE k = 'drops_total'").fetchone() == (60,)
+        assert conn.execute("SELECT DISTINCT risk_level, rows FROM plinko_rounds").fetchall() == [
+            (RISK_LEVEL_IDS["high"], 16)
+        ]
+    finally:
+        conn.close()
+    assert collector.drops_collected == 60
+    assert collector._writer is None
+
+
+def test_writer_thread_survives_a_failed_batch(db_path, monkeypatch):
+    collector = plinko_collector.PlinkoCollector(db_path=db_path)
+    real_insert = plinko_collector.INSERT_SQL
+
+    async def run():
+        await collector.init_db()
+        monkeypatch.setattr(plinko_collector, "INSERT_SQL", "INSERT INTO missing_table VALUES (?, ?, ?, ?, ?)")
+        collector._start_writer()
+        collector.parse_ws_message({"id": "lost", "multiplier": 1.5, "slot": 3})
+        # Let the failing batch commit (or rather, fail) before fixing the SQL
+        await asyncio.sleep(plinko_collector.DROP_BATCH_WAIT_SECONDS * 10)
+        monkeypatch.setattr(plinko_collector, "INSERT_SQL", real_insert)
+        collector.parse_ws_message({"id": "kept", "multiplier": 1.5, "slot": 3})
+        await collector._stop_writer()
+        await asyncio.sleep(0)
+        await collector.close()
+
+    asyncio.run(run())
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT drop_id FROM plinko_rounds").fetchall() == [("kept",)]
+    finally:
+        conn.close()
+    assert collector.drops_collected == 1
+
+
+def test_save_drop_reports_duplicates(db_path):
+    collector = plinko_collector.PlinkoCollector(db_path=db_path)
+
+    async def run():
+        await collector.init_db()
+        first = await collector.save_drop("dup", "high", 16, 3, 2.5)
+        second = await collector.save_drop("dup", "high", 16, 3, 2.5)
+        await collector.close()
+        return first, second
+
+    assert asyncio.run(run()) == (True, False)
+    assert collector.drops_collected == 1
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM plinko_rounds").fetchone() == (1,)
+    finally:
+        conn.close()
+
+
+FLAT_FRAME = {"type": "result", "id": "a1", "risk": "high", "rows": 16, "slot": 3, "multiplier": 2.5}
+NESTED_FRAME = {"type": "result", "data": {"id": "a1", "risk": "low", "rows": 8, "slot": 2, "payout": 1.5}}
+
+# (learned frame, next frame, whether the next frame takes the learned path)
+EXTRACTION_CASES = {
+    "same shape, new values": (
+        FLAT_FRAME, {**FLAT_FRAME, "id": "a2", "slot": "7", "multiplier": "0.5"}, True),
+    "nested same shape": (
+        NESTED_FRAME, {"type": "result", "data": {**NESTED_FRAME["data"], "slot": 5}}, True),
+    "extra key": (
+        FLAT_FRAME, {**FLAT_FRAME, "payout": 9.0}, False),
+    "missing key": (
+        FLAT_FRAME, {k: v for k, v in FLAT_FRAME.items() if k != "risk"}, False),
+    "nesting moves to result": (
+        NESTED_FRAME, {"type": "result", "result": NESTED_FRAME["data"]}, False),
+    "nested level gains a key": (
+        NESTED_FRAME, {"type": "result", "data": {**NESTED_FRAME["data"], "multiplier": 4.0}}, False),
+    "unvisited key becomes a dict": (
+        {"payout": 2.0, "slot": 1, "data": 0}, {"payout": 2.0, "slot": 1, "data": {"id": "x"}}, False),
+    "learned key holds a dict": (
+        FLAT_FRAME, {**FLAT_FRAME, "multiplier": {"value": 2.5}}, False),
+    "learned key holds None": (
+        FLAT_FRAME, {**FLAT_FRAME, "slot": None}, False),
+    "learned key does not convert": (
+        FLAT_FRAME, {**FLAT_FRAME, "slot": "left"}, False),
+    "skipped candidate becomes a scalar": (
+        {**FLAT_FRAME, "multiplier": {"value": 2.5}, "payout": 1.5},
+        {**FLAT_FRAME, "multiplier": 3.0, "payout": 1.5}, False),
+    "skipped candidate stays a dict": (
+        {**FLAT_FRAME, "multiplier": {"value": 2.5}, "payout": 1.5},
+        {**FLAT_FRAME, "multiplier": {"value": 3.0}, "payout": 0.5}, True),
+}
+
+
+@pytest.mark.parametrize("learned,frame,fast", EXTRACTION_CASES.values(), ids=EXTRACTION_CASES.keys())
+def test_fast_path_matches_generic_extraction(learned, frame, fast, monkeypatch):
+    collector = plinko_collector.PlinkoCollector(db_path="unused.db")
+    collector._extract_fields(learned)
+    assert collector._fast_path is not None
+
+    expected, expected_path = plinko_collector.PlinkoCollector._extract_all(collector, frame)
+    generic_calls = []
+    extract_all = collector._extract_all
+    monkeypatch.setattr(collector, "_extract_all", lambda data: generic_calls.append(data) or extract_all(data))
+
+    assert collector._extract_fields(frame) == expected
+    assert generic_calls == ([] if fast else [frame])
+    if not fast:
+        assert collector._fast_path == expected_path
+
+
+def test_fast_path_is_relearned_after_a_fallback(monkeypatch):
+    collector = plinko_collector.PlinkoCollector(db_path="unused.db")
+    generic_calls = []
+    extract_all = collector._extract_all
+    monkeypatch.setattr(collector, "_extract_all", lambda data: generic_calls.append(data) or extract_all(data))
+
+    collector._extract_fields(FLAT_FRAME)
+    learned = collector._fast_path
+
+    # A value that fails to convert forgets the path instead of learning it
+    assert "landing_position" not in collector._extract_fields({**FLAT_FRAME, "slot": "left"})
+    assert collector._fast_path is None
+
+    # A different schema is learned next and then served by the fast path
+    collector._extract_fields(NESTED_FRAME)
+    assert collector._fast_path not in (None, learned)
+    assert collector._extract_fields({"type": "result", "data": {**NESTED_FRAME["data"], "id": "b"}})["drop_id"] == "b"
+    assert len(generic_calls) == 3
+
+    # And the original schema is relearned when it comes back
+    assert collector._extract_fields(FLAT_FRAME)["multiplier"] == 2.5
+    assert collector._fast_path == learned
+    assert len(generic_calls) == 4
@@ -0,0 +1,84 @@
+"""Tests for the /api/drops endpoint."""
+
+import sqlite3
+
+import pytest
+
+import main
+from conftest import insert_drops
+
+
+@pytest.mark.parametrize("cursor", [
+    "1" * 30 + "|1",
+    "1|" + "1" * 30,
+    "9223372036854775808|1",
+    "1|9223372036854775808",
+    "12ab|1",
+    "1|2|3",
+    "²|1",
+    "",
+])
+def test_malformed_or_out_of_range_cursor_is_rejected(client, cursor):
+    response = client.get("/api/drops", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_largest_cursor_is_accepted(client):
+    response = client.get("/api/drops", params={"cursor": "9223372036854775807|9223372036854775807"})
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "total": 0, "next_cursor": None}
+
+
+def test_cursor_pages_walk_every_drop_once(client, db_path):
+    # Repeated created_at values make the id tie-breaker matter
+    insert_drops(db_path, [
+        (f"d{i:02d}", i % 3, 16, i % 16, 1.0 + i, 1_700_000_000_000 + (i // 4) * 1000)
+        for i in range(23)
+    ])
+    expected = [f"d{i:02d}" for i in sorted(range(23), key=lambda i: (i // 4, i), reverse=True)]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 5}
+        if cursor is not None:
+            params["cursor"] = cursor
+        page = client.get("/api/drops", params=params).json()
+        assert page["total"] == 23
+        seen += [item["drop_id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+    by_offset = [
+        item["drop_id"]
+        for offset in range(0, 23, 5)
+        for item in client.get("/api/drops", params={"limit": 5, "offset": offset}).json()["items"]
+    ]
+    assert by_offset == expected
+
+
+def test_reader_gives_up_on_a_lock_quickly(client):
+    timeout_ms = main.db_manager.reader().execute("PRAGMA busy_timeout").fetchone()[0]
+
+    assert timeout_ms == main.READER_BUSY_TIMEOUT_SECONDS * 1000
+
+
+def test_busy_reader_falls_back_to_aiosqlite(client, db_path, monkeypatch):
+    insert_drops(db_path, [(f"d{i}", 0, 16, 3, 1.5, 1_700_000_000_000 + i) for i in range(3)])
+    expected = client.get("/api/drops", params={"limit": 2}).json()
+
+    def locked_reader():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(main.db_manager, "reader", locked_reader)
+    main._agg_cache.clear()
+
+    assert client.get("/api/drops", params={"limit": 2}).json() == expected
+    next_page = client.get("/api/drops", params={"limit": 2, "cursor": expected["next_cursor"]}).json()
+    assert [item["drop_id"] for item in next_page["items"]] == ["d0"]
+    assert client.get("/api/health").json()["status"] == "healthy"
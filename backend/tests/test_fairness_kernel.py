@@ -0,0 +1,31 @@
+"""The numba fairness kernel and its NumPy fallback must agree."""
+
+import numpy as np
+import pytest
+
+import game_stats
+
+numba = pytest.importorskip("numba")
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_numba_and_numpy_kernels_agree(weighted):
+    rng = np.random.default_rng(7)
+    # Includes out-of-range slots, which both kernels must ignore
+    slots = rng.integers(-2, 18, size=5000).astype(game_stats.SLOT_DTYPE)
+    weights = rng.integers(1, 50, size=slots.size) if weighted else game_stats._NO_WEIGHTS
+    n = int(weights.sum()) if weighted else slots.size
+
+    jit_kernel = numba.njit(cache=False, fastmath=True)(game_stats._fairness_kernel_loop)
+    jit_counts, jit_chi, jit_dev = jit_kernel(slots, weights, game_stats.THEO_ARR, n)
+    np_counts, np_chi, np_dev = game_stats._fairness_kernel_numpy(
+        slots, weights, game_stats.THEO_ARR, n,
+    )
+
+    assert jit_counts.tolist() == np_counts.tolist()
+    assert jit_chi == pytest.approx(np_chi, rel=1e-12)
+    np.testing.assert_allclose(jit_dev, np_dev, rtol=1e-12, atol=1e-12)
+
+
+def test_numba_kernel_is_used_when_installed():
+    assert game_stats._fairness_kernel is not game_stats._fairness_kernel_numpy
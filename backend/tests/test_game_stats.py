@@ -0,0 +1,134 @@
+"""Tests for the /api/v2/plinko statistics service."""
+
+import asyncio
+import sqlite3
+import time
+
+import numpy as np
+
+import game_stats
+from conftest import insert_drops
+from main import DatabaseManager
+from plinko_schema import RISK_LEVEL_IDS
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def test_get_drops_arrays_streams_the_window_newest_first(db_path, monkeypatch):
+    now = _now_ms()
+    high = RISK_LEVEL_IDS["high"]
+    insert_drops(db_path, [
+        (f"h{i}", high, 16, i % 16, 1.0 + i, now - i * 1000) for i in range(10)
+    ] + [
+        ("old", high, 16, 3, 0.5, now - 48 * 3600 * 1000),
+        ("low", RISK_LEVEL_IDS["low"], 16, 3, 0.5, now),
+    ])
+    # Several fetch batches, the last one partial
+    monkeypatch.setattr(game_stats, "DROP_FETCH_SIZE", 3)
+
+    async def fetch():
+        manager = DatabaseManager(db_path)
+        try:
+            service = game_stats.PlinkoStatsService(manager)
+            return await service.get_drops_arrays(hours=24, risk_level="high")
+        finally:
+            await manager.close()
+
+    slots, mults, created_at = asyncio.run(fetch())
+
+    assert slots.tolist() == [i % 16 for i in range(10)]
+    assert mults.tolist() == [1.0 + i for i in range(10)]
+    assert created_at.dtype == np.dtype("datetime64[ms]")
+    assert created_at.astype(np.int64).tolist() == [now - i * 1000 for i in range(10)]
+
+
+def test_get_drops_arrays_empty_window(db_path):
+    async def fetch():
+        manager = DatabaseManager(db_path)
+        try:
+            return await game_stats.PlinkoStatsService(manager).get_drops_arrays(hours=1)
+        finally:
+            await manager.close()
+
+    assert [column.size for column in asyncio.run(fetch())] == [0, 0, 0]
+
+
+def test_v2_endpoints_read_plinko_rounds(client, db_path):
+    now = _now_ms()
+    insert_drops(db_path, [
+        ("l1", RISK_LEVEL_IDS["low"], 16, 7, 1.4, now - 3000),
+        ("m1", RISK_LEVEL_IDS["medium"], 16, 0, 0.3, now - 2000),
+        ("h1", RISK_LEVEL_IDS["high"], 16, 7, 110.0, now - 1000),
+        ("h2", RISK_LEVEL_IDS["high"], 16, 0, 0.2, now),
+    ])
+
+    stats = client.get("/api/v2/plinko", params={"period": "24h"})
+    assert stats.status_code == 200
+    body = stats.json()
+    assert body["total_drops"] == 4
+    assert set(body["slot_distributions"]) == {"low", "medium", "high"}
+    assert body["jackpot_tracker"]["total_jackpots"] == 1
+    assert body["jackpot_tracker"]["drops_since_jackpot"] == 1
+
+    slots = client.get("/api/v2/plinko/slots/high").json()
+    assert slots["total_drops"] == 2
+    assert slots["most_hit_slot"] == 0
+
+    fairness = client.get("/api/v2/plinko/fairness/low")
+    assert fairness.status_code == 200
+    assert sum(row["observed"] for row in fairness.json()["slot_comparisons"]) == 1
+
+    comparison = client.get("/api/v2/plinko/risk-comparison").json()
+    assert [row["risk_level"] for row in comparison] == ["low", "medium", "high"]
+    assert [row["total_drops"] for row in comparison] == [1, 1, 2]
+
+    jackpot = client.get("/api/v2/plinko/jackpot").json()
+    assert jackpot["total_jackpots"] == 1
+
+
+def _query_plan(db_path, query, params):
+    conn = sqlite3.connect(db_path)
+    try:
+        return " ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + query, params))
+    finally:
+        conn.close()
+
+
+def test_window_queries_use_the_plinko_rounds_indexes(db_path):
+    per_risk = _query_plan(db_path, game_stats.DROP_COLUMN_QUERIES[(True, True)], (0, 2))
+    assert "USING INDEX idx_risk_created (risk_level=? AND created_at>?)" in per_risk
+
+    histogram = _query_plan(db_path, game_stats.SLOT_HISTOGRAM_QUERIES[True], (0,))
+    assert "USING INDEX idx_created_id (created_at>?)" in histogram
+
+
+def test_concurrent_misses_compute_statistics_once(db_path, monkeypatch):
+    monkeypatch.setattr(game_stats, "STATS_CACHE_TTL_SECONDS", 60.0)
+    calls = []
+
+    async def run():
+        manager = DatabaseManager(db_path)
+        try:
+            service = game_stats.PlinkoStatsService(manager)
+            compute = service._compute_statistics
+
+            async def counting_compute(period):
+                calls.append(period)
+                # Keep the computation in flight long enough for every request to miss
+                await asyncio.sleep(0.05)
+                return await compute(period)
+
+            service._compute_statistics = counting_compute
+            return await asyncio.gather(
+                *(service.get_statistics("24h") for _ in range(5)),
+                *(service.get_statistics("7d") for _ in range(5)),
+            )
+        finally:
+            await manager.close()
+
+    results = asyncio.run(run())
+
+    assert sorted(calls) == ["24h", "7d"]
+    assert len({id(stats) for stats in results[:5]}) == 1
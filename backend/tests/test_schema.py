@@ -0,0 +1,155 @@
+"""Tests for the shared schema migration and the API reading its result."""
+
+import calendar
+import sqlite3
+import time
+
+import pytest
+
+import plinko_schema
+from conftest import api_client, insert_drops
+from plinko_schema import RISK_LEVEL_IDS
+
+LEGACY_DDL = """
+    CREATE TABLE plinko_rounds (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        drop_id TEXT UNIQUE NOT NULL,
+        risk_level TEXT NOT NULL,
+        rows INTEGER NOT NULL,
+        landing_position INTEGER NOT NULL,
+        multiplier REAL NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX idx_risk_level ON plinko_rounds(risk_level);
+    CREATE INDEX idx_created ON plinko_rounds(created_at);
+"""
+
+LEGACY_ROWS = [
+    ("a", "low", 8, 1, 0.5, "2026-01-15 10:30:00"),
+    ("b", "HIGH", 16, 7, 110.0, "2026-01-15 10:30:01"),
+    ("c", "extreme", 12, 3, 1.5, "2026-01-15 10:30:01"),
+    ("d", "Medium", 12, 4, 2.0, "2026-01-16 00:00:00"),
+]
+
+
+def _epoch_ms(text: str) -> int:
+    return calendar.timegm(time.strptime(text, "%Y-%m-%d %H:%M:%S")) * 1000
+
+
+@pytest.fixture
+def legacy_db(tmp_path) -> str:
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_DDL)
+    conn.executemany(
+        "INSERT INTO plinko_rounds "
+        "(drop_id, risk_level, rows, landing_position, multiplier, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        LEGACY_ROWS,
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _query(db_path, sql, params=()):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+
+def test_legacy_rows_survive_the_migration(legacy_db):
+    assert plinko_schema.migrate_path(legacy_db) is True
+
+    rows = _query(
+        legacy_db,
+        "SELECT drop_id, risk_level, typeof(risk_level), rows, landing_position, "
+        "multiplier, created_at, typeof(created_at) FROM plinko_rounds ORDER BY id",
+    )
+    expected_risk = [RISK_LEVEL_IDS[name] for name in ("low", "high", "medium", "medium")]
+    assert rows == [
+        (drop_id, risk, "integer", n_rows, position, multiplier, _epoch_ms(created), "integer")
+        for (drop_id, _, n_rows, position, multiplier, created), risk
+        in zip(LEGACY_ROWS, expected_risk)
+    ]
+    assert _query(legacy_db, "PRAGMA user_version") == [(plinko_schema.SCHEMA_VERSION,)]
+
+    indexes = {name for (name,) in _query(
+        legacy_db, "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+    )}
+    assert indexes == {"idx_multiplier", "idx_created_id", "idx_risk_created"}
+
+
+def test_migration_runs_once(legacy_db):
+    assert plinko_schema.migrate_path(legacy_db) is True
+    assert plinko_schema.migrate_path(legacy_db) is False
+    assert _query(legacy_db, "SELECT COUNT(*) FROM plinko_rounds") == [(len(LEGACY_ROWS),)]
+
+
+def test_trigger_count_matches_count_star(legacy_db):
+    plinko_schema.migrate_path(legacy_db)
+
+    def counts():
+        return (
+            _query(legacy_db, "SELECT v FROM plinko_meta WHERE k = 'drops_total'")[0][0],
+            _query(legacy_db, "SELECT COUNT(*) FROM plinko_rounds")[0][0],
+        )
+
+    assert counts() == (4, 4)
+
+    insert_drops(legacy_db, [(f"n{i}", 0, 16, 1, 1.0, 2_000_000 + i) for i in range(3)])
+    assert counts() == (7, 7)
+
+    conn = sqlite3.connect(legacy_db)
+    with conn:
+        conn.execute("DELETE FROM plinko_rounds WHERE drop_id IN ('a', 'n0')")
+        # Ignored duplicates must not be counted
+        conn.execute(
+            "INSERT OR IGNORE INTO plinko_rounds "
+            "(drop_id, risk_level, rows, landing_position, multiplier) VALUES ('b', 0, 16, 1, 1.0)"
+        )
+    conn.close()
+    assert counts() == (5, 5)
+
+
+def test_api_reads_migrated_legacy_rows(legacy_db, monkeypatch):
+    plinko_schema.migrate_path(legacy_db)
+
+    with api_client(legacy_db, monkeypatch) as client:
+        body = client.get("/api/drops", params={"limit": 10}).json()
+
+    assert body["total"] == 4
+    assert [item["drop_id"] for item in body["items"]] == ["d", "c", "b", "a"]
+    assert [item["risk_level"] for item in body["items"]] == ["medium", "medium", "high", "low"]
+    assert body["items"][0]["created_at"] == "2026-01-16T00:00:00"
+
+
+def test_api_refuses_to_start_on_an_unmigrated_database(legacy_db, monkeypatch):
+    with pytest.raises(RuntimeError, match="schema version 0"):
+        with api_client(legacy_db, monkeypatch):
+            pass
+
+    assert _query(legacy_db, "PRAGMA user_version") == [(0,)]
+    assert _query(legacy_db, "SELECT typeof(created_at) FROM plinko_rounds LIMIT 1") == [("text",)]
+
+
+def test_api_creates_the_schema_on_a_new_database(tmp_path, monkeypatch):
+    path = str(tmp_path / "new.db")
+
+    with api_client(path, monkeypatch) as client:
+        drops = client.get("/api/drops").json()
+        summary = client.get("/api/stats/summary")
+
+    assert drops == {"items": [], "total": 0, "next_cursor": None}
+    assert summary.status_code == 200
+    assert _query(path, "PRAGMA user_version") == [(plinko_schema.SCHEMA_VERSION,)]
+
+
+def test_create_if_missing_leaves_existing_tables_alone(legacy_db):
+    assert not plinko_schema.create_if_missing_path(legacy_db)
+    assert _query(legacy_db, "PRAGMA user_version") == [(0,)]
+
+    plinko_schema.migrate_path(legacy_db)
+    assert not plinko_schema.create_if_missing_path(legacy_db)